@@ -16,6 +16,9 @@ class Settings(BaseSettings):
     cache_ttl_seconds: int = Field(300, description="Cache TTL in seconds")
     cache_max_size: int = Field(100, description="Maximum number of cached items")
 
+    # Upstream API Settings
+    max_concurrent_requests: int = Field(20, ge=1, description="Maximum number of concurrent upstream API requests")
+
     model_config = SettingsConfigDict(env_file=".env", env_prefix="ASSEMBLY_", extra="ignore")
 
 
@@ -3,13 +3,13 @@ import contextlib
 import json
 import logging
 import time
-from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 
 import mcp.types as mt
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
+from assemblymcp.cache import TTLCache
 from assemblymcp.config import settings
 from assemblymcp.initialization import ensure_master_list
 
@@ -145,16 +145,16 @@ class LoggingMiddleware(Middleware):
 
 class CachingMiddleware(Middleware):
     def __init__(self):
-        self.cache = OrderedDict()
-        self.ttl = settings.cache_ttl_seconds
-        self.max_size = settings.cache_max_size
+        # Sized by the same settings as the service-level response cache (services._response_cache)
+        self.cache = TTLCache(settings.cache_ttl_seconds, settings.cache_max_size)
 
     def _get_cache_key(self, tool_name: str, arguments: dict | None) -> str:
         args_str = json.dumps(arguments, sort_keys=True) if arguments else ""
         return f"{tool_name}:{args_str}"
 
     def _is_cacheable(self, tool_name: str) -> bool:
-        return tool_name.startswith(("get_", "search_", "list_"))
+        # Read-only tools; analyze_* composites fan out to many upstream calls, so they benefit most
+        return tool_name.startswith(("get_", "search_", "list_", "analyze_"))
 
     async def on_call_tool(
         self,
@@ -172,31 +172,19 @@ class CachingMiddleware(Middleware):
         key = self._get_cache_key(tool_name, arguments)
 
         # Check cache
-        if key in self.cache:
-            entry = self.cache[key]
-            if time.time() < entry["expires_at"]:
-                # Mark result as cached for logging
-                result = entry["result"]
-                # Move to end (most recently used)
-                self.cache.move_to_end(key)
-
-                with contextlib.suppress(AttributeError, TypeError):
-                    result._is_cached = True
-
-                return result
-            else:
-                # Expired
-                del self.cache[key]
+        result = self.cache.get(key)
+        if result is not None:
+            # Mark result as cached for logging
+            with contextlib.suppress(AttributeError, TypeError):
+                result._is_cached = True
+
+            return result
 
         # Cache miss
         result = await call_next(context)
 
         is_error = result.isError if hasattr(result, "isError") else False
         if not is_error:
-            # Evict if full
-            if len(self.cache) >= self.max_size:
-                self.cache.popitem(last=False)  # Remove first (least recently used)
-
-            self.cache[key] = {"result": result, "expires_at": time.time() + self.ttl}
+            self.cache.set(key, result)
 
         return result
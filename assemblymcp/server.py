@@ -86,6 +86,9 @@ else:
 
 ServiceT = TypeVar("ServiceT")
 
+# Characters Mermaid does not accept in node IDs
+_MERMAID_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_]")
+
 
 def _require_service[ServiceT](service: ServiceT | None) -> ServiceT:
     """Ensure the API client and requested service are available."""
@@ -619,12 +622,12 @@ def _add_edge(edges: list[dict[str, Any]], source: str, target: str, relation: s
 def _mermaid_graph(nodes: dict[str, dict[str, Any]], edges: list[dict[str, Any]]) -> str:
     lines = ["graph TD"]
     for node_id, node in nodes.items():
-        safe_id = re.sub(r"[^A-Za-z0-9_]", "_", node_id)
+        safe_id = _MERMAID_UNSAFE_RE.sub("_", node_id)
         label = str(node.get("label", "")).replace('"', "'")
         lines.append(f'  {safe_id}["{label}"]')
     for edge in edges:
-        source = re.sub(r"[^A-Za-z0-9_]", "_", edge["source"])
-        target = re.sub(r"[^A-Za-z0-9_]", "_", edge["target"])
+        source = _MERMAID_UNSAFE_RE.sub("_", edge["source"])
+        target = _MERMAID_UNSAFE_RE.sub("_", edge["target"])
         relation = str(edge["relation"]).replace('"', "'")
         lines.append(f"  {source} -->|{relation}| {target}")
     return "\n".join(lines)
@@ -1,7 +1,15 @@
+import asyncio
 import contextlib
+import heapq
 import logging
 import re
-from datetime import datetime
+import weakref
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Sequence
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 
 import httpx
@@ -9,6 +17,7 @@ from assembly_client.api import AssemblyAPIClient
 from assembly_client.errors import AssemblyAPIError, SpecParseError
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from assemblymcp.cache import TTLCache
 from assemblymcp.config import settings
 from assemblymcp.models import (
     Bill,
@@ -21,13 +30,71 @@ from assemblymcp.models import (
 
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+# "홍길동의원 등 10인" -> name="홍길동", count="10"
+_PROPOSER_RE = re.compile(r"^(?P<name>.+?)(?:\s*의원)?\s*(?:등|외)\s*(?P<count>\d+)(?:인|명)")
+
+# Columns only the bill search API (O4K6HM0012064I15889) returns. Rows carrying them use
+# the canonical search schema, so the legacy alias keys never need to be probed.
+_BILL_SEARCH_MARKER_KEYS = ("CURR_COMMITTEE_ID", "RST_MONA_CD")
+
+_SERVICE_LIST_CACHE_TTL_SECONDS = 3600
+_SERVICE_LIST_CACHE_MAX_SIZE = 256
+
+# Raw get_data() responses keyed by (service_id, params); only used when settings.enable_caching is on.
+# Entries remember the client that fetched them so different clients never share responses.
+# This is the single cache for upstream rows (services rebuild models from it); CachingMiddleware
+# separately caches whole tool results on top.
+_response_cache = TTLCache(settings.cache_ttl_seconds, settings.cache_max_size)
+# get_data() calls currently in flight, keyed by (id(client), service_id, params)
+_inflight_requests: dict[tuple[Any, ...], asyncio.Task] = {}
+# Number of callers currently awaiting each in-flight task
+_inflight_waiters: dict[asyncio.Task, int] = {}
+
+# Per-event-loop semaphores bounding concurrent client.get_data() calls to settings.max_concurrent_requests
+_request_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Assembly ages tried by the current-session-first bill lookups: current session, then the previous one
+_FALLBACK_AGES: tuple[str, str] = ("22", "21")
+
+# Date formats accepted by BillService._parse_date, tried in order
+_DATE_FORMATS = ("%Y%m%d", "%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d")
+
+# Assembly age -> schedule API UNIT_CD for every realistic age, keyed by both str and int.
+_UNIT_CD_BY_AGE: dict[int | str, str] = {key: str(100000 + age) for age in range(1, 30) for key in (age, str(age))}
+
+# 의안 처리상태 코드 -> 표시명 (keyed by both str and int, since the API returns either)
+_PROC_STATUS_MAP: dict[int | str, str] = {
+    key: name
+    for code, name in (
+        ("1000", "접수"),
+        ("2000", "위원회 심사"),
+        ("3000", "본회의 심의"),
+        ("4000", "의결"),
+        ("5000", "폐기"),
+    )
+    for key in (code, int(code))
+}
+
+
+def _proc_status_name(code: Any) -> str:
+    """Map a processing status code to its display name, falling back to the code itself."""
+    return _PROC_STATUS_MAP.get(code) or str(code)
+
+
+def _strip_whitespace(text: str) -> str:
+    """Remove all whitespace (same set as regex \\s), without going through the regex engine."""
+    return "".join(text.split())
+
 
 def normalize_unit_cd(val: Any) -> str:
     """Normalize UNIT_CD to 1000xx format."""
     if val is None:
         return ""
     s_val = str(val)
-    digits = re.sub(r"[^0-9]", "", s_val)
+    digits = _NON_DIGIT_RE.sub("", s_val)
     if digits and len(digits) <= 2:
         return f"1000{digits.zfill(2)}"
     if digits and len(digits) == 6 and digits.startswith("1000"):
@@ -40,7 +107,7 @@ def normalize_age(val: Any) -> str:
     if val is None:
         return ""
     s_val = str(val)
-    digits = re.sub(r"[^0-9]", "", s_val)
+    digits = _NON_DIGIT_RE.sub("", s_val)
     if len(digits) == 6 and digits.startswith("1000"):
         return digits[4:]
     return digits
@@ -52,10 +119,12 @@ def normalize_age(val: Any) -> str:
     retry=retry_if_exception_type((AssemblyAPIError, httpx.RequestError)),
     reraise=True,
 )
-async def _get_data_with_retry(client: AssemblyAPIClient, service_id: str, params: dict[str, Any]) -> list[Any] | str:
+async def _fetch_data_with_retry(client: AssemblyAPIClient, service_id: str, params: dict[str, Any]) -> list[Any] | str:
     """Fetch data from API with retry logic."""
     try:
-        return await client.get_data(service_id_or_name=service_id, params=params)
+        # Hold a slot only for the request itself, not for the backoff between retries
+        async with _request_semaphore():
+            return await client.get_data(service_id_or_name=service_id, params=params)
     except Exception as e:
         # If it's already an AssemblyAPIError or httpx error, it will be retried
         # We can log the attempt here if needed
@@ -63,20 +132,155 @@ async def _get_data_with_retry(client: AssemblyAPIClient, service_id: str, param
         raise
 
 
-def _collect_rows(raw_data: Any) -> list[dict[str, Any]]:
+def _request_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's upstream request semaphore, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _request_semaphores[loop] = asyncio.Semaphore(settings.max_concurrent_requests)
+    return semaphore
+
+
+async def _get_data_with_retry(client: AssemblyAPIClient, service_id: str, params: dict[str, Any]) -> list[Any] | str:
+    """Fetch data from API with retry logic.
+
+    Concurrent identical requests share one upstream call, and recent responses are reused when caching is enabled.
+    """
+    # Param keys are unique, so sorting never has to compare values
+    params_key = tuple(sorted(params.items()))
+    try:
+        hash(params_key)
+    except TypeError:
+        # Unhashable param values (e.g. lists passed through call_raw) are fetched as-is
+        return await _fetch_data_with_retry(client, service_id, params)
+
+    cache_key = (service_id, params_key)
+    if settings.enable_caching:
+        cached = _response_cache.get(cache_key)
+        if cached is not None and cached[0] is client:
+            return cached[1]
+
+    # The caller keeps the client alive while awaiting, so id(client) can't be reused by another client meanwhile
+    inflight_key = (id(client), service_id, params_key)
+    task = _inflight_requests.get(inflight_key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.create_task(_fetch_data_with_retry(client, service_id, params))
+        _inflight_requests[inflight_key] = task
+        task.add_done_callback(lambda done: _forget_inflight_request(inflight_key, done))
+
+    # Shield the shared fetch so one cancelled caller doesn't cancel it for the others
+    _inflight_waiters[task] = _inflight_waiters.get(task, 0) + 1
+    try:
+        data = await asyncio.shield(task)
+    finally:
+        remaining = _inflight_waiters.pop(task) - 1
+        if remaining:
+            _inflight_waiters[task] = remaining
+        elif not task.done():
+            # The last caller was cancelled: stop the shared fetch (and its retries) instead of orphaning it
+            _forget_inflight_request(inflight_key, task)
+            task.cancel()
+    # Only cache row lists; failures raise and are never stored
+    if settings.enable_caching and isinstance(data, list):
+        _response_cache.set(cache_key, (client, data))
+    return data
+
+
+def _forget_inflight_request(key: tuple[Any, ...], task: asyncio.Task) -> None:
+    if _inflight_requests.get(key) is task:
+        del _inflight_requests[key]
+
+
+def _clean_text(value: Any) -> str:
+    """Normalize a single column value: None -> "", strings stripped, anything else str()."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value)
+
+
+def _yyyymmdd_to_iso(digits: str) -> str | None:
+    """Convert an 8-digit YYYYMMDD string to YYYY-MM-DD, or None if it is not a real date."""
+    try:
+        return date(int(digits[:4]), int(digits[4:6]), int(digits[6:])).isoformat()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(candidate: str) -> str | None:
+    """Parse a stripped, non-empty date string to YYYY-MM-DD (None if unparseable).
+
+    Bill rows repeat the same few dates (PROPOSE_DT, COMMITTEE_DT, PROC_DT), so results are memoized.
+    """
+    # Fast path for the dominant YYYYMMDD form: slice instead of strptime
+    if len(candidate) == 8 and candidate.isascii() and candidate.isdigit():
+        parsed_iso = _yyyymmdd_to_iso(candidate)
+        if parsed_iso:
+            return parsed_iso
+
+    # Same for zero-padded YYYY-MM-DD / YYYY/MM/DD / YYYY.MM.DD
+    if len(candidate) == 10 and candidate[4] == candidate[7] and candidate[4] in "-/.":
+        digits = candidate[:4] + candidate[5:7] + candidate[8:]
+        if digits.isascii() and digits.isdigit():
+            parsed_iso = _yyyymmdd_to_iso(digits)
+            if parsed_iso:
+                return parsed_iso
+
+    for fmt in _DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(candidate, fmt).date()
+            return parsed.isoformat()
+        except ValueError:
+            continue
+
+    # Already all ASCII digits (e.g. a 7- or 9-digit number): nothing for the regex to strip
+    digits_only = candidate if candidate.isascii() and candidate.isdigit() else _NON_DIGIT_RE.sub("", candidate)
+    if len(digits_only) == 8:
+        return _yyyymmdd_to_iso(digits_only)
+
+    return None
+
+
+def _propose_dt_key(bill: Bill) -> str:
+    return bill.PROPOSE_DT or ""
+
+
+def _meeting_date_key(row: dict[str, Any]) -> str:
+    # Rows are model dumps, so MEETING_DATE is present but None when the schedule has no date
+    return row.get("MEETING_DATE") or ""
+
+
+def _iter_rows(raw_data: Any) -> Iterator[dict[str, Any]]:
+    """Lazily yield get_data() rows as dicts (see _collect_rows), converting each one only when reached."""
+    if not raw_data or isinstance(raw_data, str):
+        return iter(())
+    return (item.model_dump() if hasattr(item, "model_dump") else item for item in raw_data)
+
+
+def _collect_rows(raw_data: Any, max_rows: int | None = None) -> list[dict[str, Any]]:
     """Convert get_data() result to a flat list of dicts.
 
     get_data() returns list[BaseModel] (generated types) or list[dict] (fallback).
-    Both cases are handled uniformly here.
+    Both cases are handled uniformly here. When max_rows is given, only that many
+    leading rows are converted.
     """
     if not raw_data or isinstance(raw_data, str):
         return []
+    if max_rows is not None:
+        raw_data = islice(raw_data, max_rows)
     return [item.model_dump() if hasattr(item, "model_dump") else item for item in raw_data]
 
 
 class DiscoveryService:
     def __init__(self, client: AssemblyAPIClient):
         self.client = client
+        # list_services results per keyword, valid while client.service_metadata is the same object
+        self._services_cache = TTLCache(_SERVICE_LIST_CACHE_TTL_SECONDS, _SERVICE_LIST_CACHE_MAX_SIZE)
+        self._services_source: dict[str, Any] | None = None
+        # (service_id, name, category, description, lowered search text, space-stripped search text)
+        self._services_index: list[tuple[str, str, str, str, str, str]] = []
 
     def _normalize_params(self, params: dict[str, Any]) -> dict[str, Any]:
         """
@@ -100,33 +304,60 @@ class DiscoveryService:
 
         return normalized
 
+    @staticmethod
+    def _build_services_index(service_metadata: dict[str, Any]) -> list[tuple[str, str, str, str, str, str]]:
+        """Lower-case each service's searchable text once per metadata load, ordered by name."""
+        index = []
+        for service_id, metadata in service_metadata.items():
+            name = metadata.get("name", "")
+            description = metadata.get("description", "")
+            target_text = f"{name} {description} {service_id}".lower()
+            index.append(
+                (
+                    service_id,
+                    name,
+                    metadata.get("category", ""),
+                    description,
+                    target_text,
+                    _strip_whitespace(target_text),
+                )
+            )
+        # Stable sort, so filtered results come out in the same order the old per-call sort produced
+        index.sort(key=itemgetter(1))
+        return index
+
     async def list_services(self, keyword: str = "") -> list[dict[str, str]]:
         """
         Search for available API services by keyword.
         Improved to be flexible with spaces and case.
         """
-        results = []
-
         # Split keyword into tokens for multi-word matching
         search_tokens = keyword.lower().split() if keyword else []
-        stripped_keyword = re.sub(r"\s+", "", keyword).lower() if keyword else ""
+        stripped_keyword = _strip_whitespace(keyword).lower() if keyword else ""
 
-        # Iterate through all service metadata
-        for service_id, metadata in self.client.service_metadata.items():
-            name = metadata.get("name", "")
-            description = metadata.get("description", "")
-            category = metadata.get("category", "")
+        # Service metadata is static unless the client reloads it (ensure_master_list swaps in a new dict)
+        service_metadata = self.client.service_metadata
+        if service_metadata is not self._services_source:
+            self._services_cache.clear()
+            self._services_index = self._build_services_index(service_metadata)
+            self._services_source = service_metadata
 
-            # Filter by keyword if provided
-            if search_tokens:
-                target_text = f"{name} {description} {service_id}".lower()
+        cache_key = tuple(search_tokens)
+        cached = self._services_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
 
-                # All tokens must be present in the target text
-                if not all(token in target_text for token in search_tokens):
-                    # Also try space-stripped matching as a fallback
-                    stripped_target = re.sub(r"\s+", "", target_text)
-                    if stripped_keyword not in stripped_target:
-                        continue
+        results = []
+
+        for service_id, name, category, description, target_text, stripped_target in self._services_index:
+            # Filter by keyword if provided: all tokens must be present in the target text,
+            # with space-stripped matching as a fallback
+            if (
+                search_tokens
+                and not all(token in target_text for token in search_tokens)
+                and stripped_keyword not in stripped_target
+            ):
+                continue
 
             results.append(
                 {
@@ -137,8 +368,8 @@ class DiscoveryService:
                 }
             )
 
-        # Sort by name
-        results.sort(key=lambda x: x["name"])
+        # Already sorted by name (the index is)
+        self._services_cache.set(cache_key, tuple(results))
         return results
 
     async def call_raw(self, service_id_or_name: str, params: dict[str, Any]) -> list[dict[str, Any]]:
@@ -187,8 +418,8 @@ class DiscoveryService:
             # But for raw calls we generally want to be minimal.
             # Let's try minimal first.
 
-            raw_data = await self.call_raw(service_id, params=params)
-            rows = _collect_rows(raw_data)
+            # call_raw already returns collected rows (cached in _response_cache when caching is on)
+            rows = await self.call_raw(service_id, params=params)
             return rows[0] if rows else None
         except Exception as e:
             logger.warning(f"Preview fetch failed for {service_id}: {e}")
@@ -196,47 +427,39 @@ class DiscoveryService:
 
 
 class BillService:
+    # Text status columns take precedence over the numeric code columns.
+    _STATUS_KEYS = ("PROC_STATUS", "PROC_RESULT_NM", "CURR_STATUS", "PROCESS_STAGE", "LAST_RESULT", "PROC_STATE")
+    _CODE_KEYS = ("PROC_RESULT_CD", "PROC_STATUS_CD")
+    # Detail API field names seen for the summary and the proposal reason, in priority order
+    _SUMMARY_KEYS = ("MAIN_CNTS", "SUMMARY", "CNTS", "MAJOR_CONTENT", "MAIN_CONT")
+    _REASON_KEYS = ("RSON_CONT", "PROPOSE_RSON", "RSON", "PROPOSE_REASON", "RST_PROPOSE_REASON")
+
     def __init__(self, client: AssemblyAPIClient):
         self.client = client
         self.BILL_SEARCH_ID = "O4K6HM0012064I15889"
         self.BILL_DETAIL_ID = "OS46YD0012559515463"
         self.VOTING_SUMMARY_ID = "OND1KZ0009677M13515"
         self.VOTING_RECORD_ID = "OPR1MQ000998LC12535"
-        self._proc_status_map = {
-            "1000": "접수",
-            "2000": "위원회 심사",
-            "3000": "본회의 심의",
-            "4000": "의결",
-            "5000": "폐기",
-        }
 
     def _parse_date(self, date_value: Any) -> str | None:
         if date_value is None:
             return None
 
-        candidate = str(int(date_value)) if isinstance(date_value, (int, float)) else str(date_value).strip()
+        # Exact type checks first: _build_bill always passes str, the API sometimes int.
+        value_type = type(date_value)
+        if value_type is str:
+            candidate = date_value.strip()
+        elif value_type is int or value_type is float or isinstance(date_value, (int, float)):
+            candidate = str(int(date_value))
+        else:
+            candidate = str(date_value).strip()
 
         if not candidate:
             return None
 
-        for fmt in ("%Y%m%d", "%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d"):
-            try:
-                parsed = datetime.strptime(candidate, fmt).date()
-                return parsed.isoformat()
-            except ValueError:
-                continue
+        return _parse_date_text(candidate)
 
-        digits_only = re.sub(r"[^0-9]", "", candidate)
-        if len(digits_only) == 8:
-            try:
-                parsed = datetime.strptime(digits_only, "%Y%m%d").date()
-                return parsed.isoformat()
-            except ValueError:
-                return None
-
-        return None
-
-    def _bill_field(self, row: dict[str, Any], keys: list[str], default: str = "") -> str:
+    def _bill_field(self, row: dict[str, Any], keys: Sequence[str], default: str = "") -> str:
         for key in keys:
             value = row.get(key)
             if value is None:
@@ -254,7 +477,11 @@ class BillService:
         if not text:
             return None, None
 
-        match = re.search(r"^(?P<name>.+?)(?:\s*의원)?\s*(?:등|외)\s*(?P<count>\d+)(?:인|명)", text)
+        # The pattern needs "등" or "외"; single-proposer strings skip the regex entirely
+        if "등" not in text and "외" not in text:
+            return text, None
+
+        match = _PROPOSER_RE.search(text)
         if match:
             primary = match.group("name").strip()
             try:
@@ -266,49 +493,74 @@ class BillService:
         return text, None
 
     def _normalize_proc_status(self, row: dict[str, Any]) -> str:
-        status = self._bill_field(
-            row,
-            [
-                "PROC_STATUS",
-                "PROC_RESULT_NM",
-                "CURR_STATUS",
-                "PROCESS_STAGE",
-                "LAST_RESULT",
-                "PROC_STATE",
-            ],
-        )
+        status = self._bill_field(row, self._STATUS_KEYS)
         if status:
             return status
 
-        code = row.get("PROC_RESULT_CD") or row.get("PROC_STATUS_CD")
-        if code:
-            return self._proc_status_map.get(str(code), str(code))
+        for key in self._CODE_KEYS:
+            code = row.get(key)
+            if code:
+                return _proc_status_name(code)
         return ""
 
+    def _build_bill_from_search_row(self, row: dict[str, Any]) -> Bill:
+        """Fast path for rows in the canonical bill search schema (no alias columns)."""
+        # Same as _bill_field(row, ("PROPOSER", "RST_PROPOSER")), inlined since PROPOSER is almost always set
+        proposer_raw = _clean_text(row.get("PROPOSER")) or _clean_text(row.get("RST_PROPOSER"))
+        primary_proposer, proposer_count = self._extract_proposer_info(proposer_raw)
+
+        bill_id = _clean_text(row.get("BILL_ID"))
+        bill_no = _clean_text(row.get("BILL_NO"))
+        if not bill_id and bill_no:
+            bill_id = bill_no
+
+        code = row.get("PROC_RESULT_CD")
+        proc_status = _proc_status_name(code) if code else ""
+
+        return Bill.model_construct(
+            BILL_ID=bill_id,
+            BILL_NO=bill_no or None,
+            BILL_NAME=_clean_text(row.get("BILL_NAME")),
+            PROPOSER=proposer_raw,
+            PROPOSER_KIND_NM=_clean_text(row.get("PROPOSER_KIND")),
+            PROC_STATUS=proc_status,
+            CURR_COMMITTEE=_clean_text(row.get("CURR_COMMITTEE")),
+            PROPOSE_DT=self._parse_date(_clean_text(row.get("PROPOSE_DT"))),
+            COMMITTEE_DT=self._parse_date(_clean_text(row.get("COMMITTEE_DT"))),
+            PROC_DT=self._parse_date(_clean_text(row.get("PROC_DT"))),
+            LINK_URL=_clean_text(row.get("LINK_URL")),
+            PRIMARY_PROPOSER=primary_proposer,
+            PROPOSER_COUNT=proposer_count,
+        )
+
     def _build_bill(self, row: dict[str, Any]) -> Bill:
-        proposer_raw = self._bill_field(row, ["PROPOSER", "PROPOSER_MAIN_NM", "RST_PROPOSER"])
+        if all(key in row for key in _BILL_SEARCH_MARKER_KEYS):
+            return self._build_bill_from_search_row(row)
+
+        proposer_raw = self._bill_field(row, ("PROPOSER", "PROPOSER_MAIN_NM", "RST_PROPOSER"))
         primary_proposer, proposer_count = self._extract_proposer_info(proposer_raw or "")
 
         # Extract both BILL_ID and BILL_NO separately
-        bill_id = self._bill_field(row, ["BILL_ID"])
-        bill_no = self._bill_field(row, ["BILL_NO"])
+        bill_id = _clean_text(row.get("BILL_ID"))
+        bill_no = _clean_text(row.get("BILL_NO"))
 
         # If BILL_ID is missing but BILL_NO exists, use BILL_NO as fallback for bill_id
         if not bill_id and bill_no:
             bill_id = bill_no
 
-        return Bill(
+        # All fields are already normalized to str/int/None, so skip pydantic validation.
+        return Bill.model_construct(
             BILL_ID=bill_id,
             BILL_NO=bill_no or None,
-            BILL_NAME=self._bill_field(row, ["BILL_NAME", "BILL_NM", "BILL_TITLE"]),
+            BILL_NAME=self._bill_field(row, ("BILL_NAME", "BILL_NM", "BILL_TITLE")),
             PROPOSER=proposer_raw,
-            PROPOSER_KIND_NM=self._bill_field(row, ["PROPOSER_KIND", "PROPOSER_KIND_NAME", "PROPOSER_GBN_NM"]),
+            PROPOSER_KIND_NM=self._bill_field(row, ("PROPOSER_KIND", "PROPOSER_KIND_NAME", "PROPOSER_GBN_NM")),
             PROC_STATUS=self._normalize_proc_status(row),
-            CURR_COMMITTEE=self._bill_field(row, ["CURR_COMMITTEE", "CURR_COMMITTEE_NM", "CMIT_NM", "COMMITTEE"]),
-            PROPOSE_DT=self._parse_date(self._bill_field(row, ["PROPOSE_DT", "PROPOSE_DATE"])),
-            COMMITTEE_DT=self._parse_date(self._bill_field(row, ["COMMITTEE_DT", "CMIT_DT"])),
-            PROC_DT=self._parse_date(self._bill_field(row, ["PROC_DT"])),
-            LINK_URL=self._bill_field(row, ["LINK_URL", "DETAIL_LINK"]),
+            CURR_COMMITTEE=self._bill_field(row, ("CURR_COMMITTEE", "CURR_COMMITTEE_NM", "CMIT_NM", "COMMITTEE")),
+            PROPOSE_DT=self._parse_date(self._bill_field(row, ("PROPOSE_DT", "PROPOSE_DATE"))),
+            COMMITTEE_DT=self._parse_date(self._bill_field(row, ("COMMITTEE_DT", "CMIT_DT"))),
+            PROC_DT=self._parse_date(_clean_text(row.get("PROC_DT"))),
+            LINK_URL=self._bill_field(row, ("LINK_URL", "DETAIL_LINK")),
             PRIMARY_PROPOSER=primary_proposer,
             PROPOSER_COUNT=proposer_count,
         )
@@ -321,6 +573,7 @@ class BillService:
         proposer: str | None = None,
         propose_dt: str | None = None,
         proc_status: str | None = None,
+        committee: str | None = None,
         page: int = 1,
         limit: int = 10,
     ) -> list[Bill]:
@@ -328,32 +581,69 @@ class BillService:
         Search for legislative bills and return detailed information.
         This function integrates multiple underlying Bill APIs.
         """
-        params = {
-            "AGE": normalize_age(age),  # Normalized
-            "BILL_ID": bill_id,
-            "BILL_NAME": bill_name,
-            "PROPOSER": proposer,
-            "PROPOSE_DT": propose_dt,
-            "PROC_RESULT_CD": proc_status,
-            "pIndex": page,
-            "pSize": limit,
-        }
-        # Filter out None values
-        params = {k: v for k, v in params.items() if v is not None}
-
-        # Call the primary Bill Search API with retry
+        params: dict[str, Any] = {"AGE": normalize_age(age)}  # Normalized
+        # Only send filters that were given
+        if bill_id is not None:
+            params["BILL_ID"] = bill_id
+        if bill_name is not None:
+            params["BILL_NAME"] = bill_name
+        if proposer is not None:
+            params["PROPOSER"] = proposer
+        if propose_dt is not None:
+            params["PROPOSE_DT"] = propose_dt
+        if proc_status is not None:
+            params["PROC_RESULT_CD"] = proc_status
+        if committee is not None:
+            params["CURR_COMMITTEE"] = committee
+        params["pIndex"] = page
+        params["pSize"] = limit
+
+        # Call the primary Bill Search API with retry (identical searches are served from _response_cache)
         raw_data = await _get_data_with_retry(self.client, self.BILL_SEARCH_ID, params)
-        rows = _collect_rows(raw_data)
 
-        # Transform raw data to Pydantic models
-        bills = []
-        for row in rows:
-            try:
-                bills.append(self._build_bill(row))
-            except Exception as e:
-                logger.warning(f"Error converting row to Bill model: {e}")
+        # Transform raw data to Pydantic models, streaming rows so only the first `limit` are converted.
+        # Conversion rarely fails, so build the list in one comprehension and only redo it row by row
+        # (skipping bad rows) when something raises.
+        try:
+            bills = [self._build_bill(row) for row in islice(_iter_rows(raw_data), limit)]
+        except Exception:
+            bills = []
+            for row in _iter_rows(raw_data):
+                try:
+                    bills.append(self._build_bill(row))
+                except Exception as e:
+                    logger.warning(f"Error converting row to Bill model: {e}")
+                    continue
+                if len(bills) >= limit:
+                    break
 
-        return bills[:limit]
+        return bills
+
+    async def get_bill_info_current_first(
+        self, select: Callable[[list[Bill]], list[Bill]] | None = None, **kwargs: Any
+    ) -> tuple[str, list[Bill]]:
+        """
+        Search bills in the current session, falling back to the previous one.
+        1. Runs get_bill_info with `kwargs` for the 22nd and 21st sessions concurrently.
+        2. Applies `select` (if given) to each session's bills.
+        3. Returns (age, bills) for the 22nd session when non-empty, otherwise for the 21st.
+        """
+        current_age, previous_age = _FALLBACK_AGES
+        current = asyncio.create_task(self.get_bill_info(age=current_age, **kwargs))
+        previous = asyncio.create_task(self.get_bill_info(age=previous_age, **kwargs))
+        try:
+            bills = await current
+            if select is not None:
+                bills = select(bills)
+            if bills:
+                return current_age, bills
+
+            # Fallback to previous session
+            bills = await previous
+            return previous_age, select(bills) if select is not None else bills
+        finally:
+            # No-op when the fallback already finished
+            previous.cancel()
 
     async def search_bills(self, keyword: str, page: int = 1, limit: int = 10) -> list[Bill]:
         """
@@ -361,13 +651,7 @@ class BillService:
         1. Tries to search by keyword in the current session (22nd).
         2. If no results, falls back to the previous session (21st).
         """
-        # Try current session first
-        bills = await self.get_bill_info(age="22", bill_name=keyword, page=page, limit=limit)
-        if bills:
-            return bills
-
-        # Fallback to previous session
-        bills = await self.get_bill_info(age="21", bill_name=keyword, page=page, limit=limit)
+        _, bills = await self.get_bill_info_current_first(bill_name=keyword, page=page, limit=limit)
         return bills
 
     async def get_recent_bills(self, page: int = 1, limit: int = 10) -> list[Bill]:
@@ -377,10 +661,8 @@ class BillService:
         # Fetch a slightly larger batch to ensure good sorting if API doesn't sort perfectly
         bills = await self.get_bill_info(age="22", page=page, limit=max(limit, 20))
 
-        # Sort by proposal date descending (ISO format strings sort correctly)
-        bills.sort(key=lambda x: x.PROPOSE_DT if x.PROPOSE_DT else "", reverse=True)
-
-        return bills[:limit]
+        # Newest proposals first (ISO format strings sort correctly); partial sort for the top `limit`
+        return heapq.nlargest(limit, bills, key=_propose_dt_key)
 
     async def get_bill_details(self, bill_id: str, age: str | None = None) -> BillDetail | None:
         """
@@ -408,11 +690,9 @@ class BillService:
             is_numeric_id = bill_id.isdigit() and len(bill_id) < 10
 
             if not is_numeric_id:
-                for probe_age in ["22", "21"]:
-                    bills = await self.get_bill_info(age=probe_age, bill_id=bill_id)
-                    if bills:
-                        target_bill = bills[0]
-                        break
+                _, bills = await self.get_bill_info_current_first(bill_id=bill_id)
+                if bills:
+                    target_bill = bills[0]
 
         # If we didn't find a bill object but have a numeric ID, we might still be able to fetch
         # details directly using the numeric ID as BILL_NO.
@@ -461,39 +741,29 @@ class BillService:
                 params={"BILL_NO": bill_identifier},
             )
 
-            # Log raw response structure for debugging
-            if isinstance(raw_data, dict):
-                logger.debug(f"Detail API response keys: {list(raw_data.keys())[:10]}")
-            else:
-                logger.debug(f"Detail API response type: {type(raw_data)}")
+            # Log raw response structure for debugging (skip building key lists when DEBUG is off)
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                if isinstance(raw_data, dict):
+                    logger.debug(f"Detail API response keys: {list(islice(raw_data, 10))}")
+                else:
+                    logger.debug(f"Detail API response type: {type(raw_data)}")
 
-            rows = _collect_rows(raw_data)
+            # Only the first row is used, so don't convert the rest
+            rows = _collect_rows(raw_data, max_rows=1)
 
             if rows:
                 row = rows[0]
-                logger.debug(f"Detail row contains {len(row)} keys. Sample keys: {list(row.keys())[:10]}")
+                if debug_enabled:
+                    logger.debug(f"Detail row contains {len(row)} keys. Sample keys: {list(islice(row, 10))}")
 
-                # Try to extract summary
-                summary = (
-                    row.get("MAIN_CNTS")
-                    or row.get("SUMMARY")
-                    or row.get("CNTS")
-                    or row.get("MAJOR_CONTENT")
-                    or row.get("MAIN_CONT")
-                )
-
-                # Try to extract reason
-                reason = (
-                    row.get("RSON_CONT")
-                    or row.get("PROPOSE_RSON")
-                    or row.get("RSON")
-                    or row.get("PROPOSE_REASON")
-                    or row.get("RST_PROPOSE_REASON")
-                )
+                # Try to extract summary and reason (first non-empty field wins)
+                summary = next((value for key in self._SUMMARY_KEYS if (value := row.get(key))), None)
+                reason = next((value for key in self._REASON_KEYS if (value := row.get(key))), None)
 
                 # If both fields are empty, provide diagnostic info
                 if not summary and not reason:
-                    available_keys = list(row.keys())[:15]
+                    available_keys = list(islice(row, 15))
                     logger.warning(
                         f"Bill detail API returned data for {bill_identifier} but no "
                         f"extractable summary/reason fields. Available keys: {available_keys}"
@@ -544,7 +814,8 @@ class BillService:
                 "이 문제가 지속되면 AssemblyMCP 이슈 트래커에 보고해주세요."
             )
 
-        return BillDetail(**target_bill.model_dump(), MAJOR_CONTENT=summary, PROPOSE_REASON=reason)
+        # target_bill is already a validated Bill; reuse its fields instead of dumping and re-validating them
+        return BillDetail.model_construct(**target_bill.__dict__, MAJOR_CONTENT=summary, PROPOSE_REASON=reason)
 
     async def get_bill_voting_summary(self, bill_id: str, age: str = "22") -> BillVotingSummary | None:
         """
@@ -570,6 +841,24 @@ class BillService:
             PROC_RESULT_CD=str(row.get("PROC_RESULT_CD", "")),
         )
 
+    async def get_bill_voting_summaries(
+        self, bill_ids: Sequence[str], age: str = "22"
+    ) -> list[BillVotingSummary | None]:
+        """
+        여러 의안의 본회의 표결 통계를 동시에 조회합니다 (입력 순서 유지).
+        조회에 실패한 의안은 경고를 남기고 표결 정보가 없는 의안처럼 None으로 채웁니다.
+        """
+
+        async def fetch_summary(bill_id: str) -> BillVotingSummary | None:
+            try:
+                return await self.get_bill_voting_summary(bill_id, age=age)
+            except Exception as e:
+                logger.warning(f"표결 요약 조회 중 오류 발생 (의안: '{bill_id}'): {e}")
+                return None
+
+        # The API takes one BILL_ID per request; concurrency is bounded by _get_data_with_retry
+        return await asyncio.gather(*(fetch_summary(bill_id) for bill_id in bill_ids))
+
     async def get_member_voting_history(
         self,
         name: str | None = None,
@@ -617,8 +906,7 @@ class BillService:
                 try:
                     v_data = await _get_data_with_retry(self.client, self.VOTING_RECORD_ID, v_params)
                     v_rows = _collect_rows(v_data)
-                    for row in v_rows:
-                        all_records.append(self._build_vote_record(row))
+                    all_records.extend([self._build_vote_record(row) for row in v_rows])
 
                     # 이미 충분한 기록을 찾았다면 중단
                     if len(all_records) >= limit:
@@ -635,7 +923,7 @@ class BillService:
         """대수 형식을 짧은 숫자 형식(예: '22')으로 보정합니다.
         테스트 결과 표결 API는 100022 형식이 아닌 22 형식을 요구합니다.
         """
-        clean = re.sub(r"[^0-9]", "", age)
+        clean = _NON_DIGIT_RE.sub("", age)
         if len(clean) == 6 and clean.startswith("1000"):
             return clean[4:]
         return clean
@@ -672,8 +960,8 @@ class MemberService:
         if not name:
             return rows
 
-        normalized = re.sub(r"\s+", "", name)
-        filtered = [row for row in rows if normalized in re.sub(r"\s+", "", str(row.get("HG_NM", "")))]
+        normalized = _strip_whitespace(name)
+        filtered = [row for row in rows if normalized in _strip_whitespace(str(row.get("HG_NM", "")))]
         return filtered or rows
 
     async def get_member_committee_careers(self, name: str) -> list[MemberCommitteeCareer]:
@@ -684,20 +972,16 @@ class MemberService:
         raw_data = await _get_data_with_retry(self.client, self.MEMBER_CAREER_ID, params)
         rows = _collect_rows(raw_data)
 
-        careers = []
-        for row in rows:
-            # 기간 추출 (예: "2024.06.10 ~ 2025.05.02")
-            date_range = str(row.get("FRTO_DATE", ""))
-
-            careers.append(
-                MemberCommitteeCareer(
-                    HG_NM=str(row.get("HG_NM", "")),
-                    PROFILE_SJ=str(row.get("PROFILE_SJ", "")),
-                    FRTO_DATE=date_range,
-                    PROFILE_UNIT_NM=str(row.get("PROFILE_UNIT_NM", "")),
-                )
+        # FRTO_DATE 기간 예: "2024.06.10 ~ 2025.05.02"
+        return [
+            MemberCommitteeCareer(
+                HG_NM=str(row.get("HG_NM", "")),
+                PROFILE_SJ=str(row.get("PROFILE_SJ", "")),
+                FRTO_DATE=str(row.get("FRTO_DATE", "")),
+                PROFILE_UNIT_NM=str(row.get("PROFILE_UNIT_NM", "")),
             )
-        return careers
+            for row in rows
+        ]
 
 
 class MeetingService:
@@ -724,6 +1008,10 @@ class MeetingService:
 
         """
 
+        cached = _UNIT_CD_BY_AGE.get(age)
+        if cached is not None:
+            return cached
+
         try:
             val = int(age)
 
@@ -782,44 +1070,23 @@ class MeetingService:
             f"Meeting schedule search returned {len(rows)} raw results for filters: committee={committee_name}"
         )
 
-        # Post-filtering by date
-
-        filtered = []
-
-        for row in rows:
-            # Schedule API returns MEETING_DATE (YYYY-MM-DD)
-
-            meeting_date = row.get("MEETING_DATE", "")
-
-            # Simple string comparison works for ISO format dates
-
-            if date_start and meeting_date < date_start:
-                continue
-
-            if date_end and meeting_date > date_end:
-                continue
-
-            # Remap fields to match expected output format (closer to Meeting Record API)
-
-            # MEETING_DATE -> CONF_DATE (without hyphens usually, but let's keep it ISO or normalize?)
-
-            # The original API used YYYYMMDD. Let's provide both or standardize.
-
-            # Let's keep MEETING_DATE as is and add CONF_DATE for compatibility.
-
+        # Post-filtering by date (simple string comparison works for ISO format dates).
+        # Schedule API returns MEETING_DATE (YYYY-MM-DD). Sort newest first once (stable, so equal dates
+        # keep API order) and cut the [date_start, date_end] window out with bisect instead of testing every row.
+        ordered = sorted(rows, key=_meeting_date_key, reverse=True)
+        ascending_dates = [_meeting_date_key(row) for row in reversed(ordered)]
+        total = len(ordered)
+        window_start = total - bisect_right(ascending_dates, date_end) if date_end else 0
+        window_stop = total - bisect_left(ascending_dates, date_start) if date_start else total
+
+        result = []
+        for row in ordered[window_start : min(window_stop, window_start + limit)]:
+            # Remap fields to match expected output format (closer to Meeting Record API).
+            # Keep MEETING_DATE as is and add CONF_DATE (YYYYMMDD) for compatibility.
             normalized_row = row.copy()
-
-            normalized_row["CONF_DATE"] = meeting_date.replace("-", "")  # YYYYMMDD
-
+            normalized_row["CONF_DATE"] = (row.get("MEETING_DATE") or "").replace("-", "")
             normalized_row["CONF_TITLE"] = row.get("TITLE", "")
-
-            filtered.append(normalized_row)
-
-        # Sort by date descending (newest first)
-
-        filtered.sort(key=lambda x: x.get("MEETING_DATE", ""), reverse=True)
-
-        result = filtered[:limit]
+            result.append(normalized_row)
 
         if not result:
             logger.info(
@@ -859,6 +1126,19 @@ class CommitteeService:
         # OCAJQ4001000LI18751: 위원회 위원 명단 (Committee Member Roster)
         self.COMMITTEE_MEMBER_LIST_ID = "OCAJQ4001000LI18751"
 
+    def _build_committee(self, row: dict[str, Any]) -> Committee:
+        """Raw row 데이터를 Committee 모델로 변환합니다."""
+        chair = row.get("HG_NM")
+        # Every field is coerced here, so pydantic validation can be skipped.
+        return Committee.model_construct(
+            HR_DEPT_CD=str(row.get("HR_DEPT_CD", "")),
+            COMMITTEE_NAME=str(row.get("COMMITTEE_NAME", "")),
+            CMT_DIV_NM=str(row.get("CMT_DIV_NM", "")),
+            HG_NM=str(chair) if chair is not None else None,
+            CURR_CNT=int(row.get("CURR_CNT")) if row.get("CURR_CNT") else None,
+            LIMIT_CNT=int(row.get("LIMIT_CNT")) if row.get("LIMIT_CNT") else None,
+        )
+
     async def get_committee_list(self, committee_name: str | None = None) -> list[Committee]:
         """
         Get a list of committees.
@@ -870,23 +1150,18 @@ class CommitteeService:
         raw_data = await _get_data_with_retry(self.client, self.COMMITTEE_INFO_ID, params)
         rows = _collect_rows(raw_data)
 
-        committees = []
-        for row in rows:
-            try:
-                committees.append(
-                    Committee(
-                        HR_DEPT_CD=str(row.get("HR_DEPT_CD", "")),
-                        COMMITTEE_NAME=str(row.get("COMMITTEE_NAME", "")),
-                        CMT_DIV_NM=str(row.get("CMT_DIV_NM", "")),
-                        HG_NM=row.get("HG_NM"),
-                        CURR_CNT=int(row.get("CURR_CNT")) if row.get("CURR_CNT") else None,
-                        LIMIT_CNT=int(row.get("LIMIT_CNT")) if row.get("LIMIT_CNT") else None,
-                    )
-                )
-            except (ValueError, TypeError, KeyError) as e:
-                logger.warning(f"Error parsing committee row: {e}", exc_info=True)
-            except Exception as e:
-                logger.warning(f"Unexpected error parsing committee row: {e}", exc_info=True)
+        try:
+            committees = [self._build_committee(row) for row in rows]
+        except Exception:
+            # Fall back to per-row conversion so one malformed row doesn't drop the rest
+            committees = []
+            for row in rows:
+                try:
+                    committees.append(self._build_committee(row))
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.warning(f"Error parsing committee row: {e}", exc_info=True)
+                except Exception as e:
+                    logger.warning(f"Unexpected error parsing committee row: {e}", exc_info=True)
 
         return committees
 
@@ -943,15 +1218,14 @@ class CommitteeService:
         # We must manually filter by committee_code if it was provided.
         if committee_code:
             rows = [row for row in rows if str(row.get("DEPT_CD") or row.get("HR_DEPT_CD") or "") == committee_code]
+            # Nothing left for the name filter to narrow down
+            if not rows:
+                return []
 
         # If a name was provided, post-filter in case the API lacks fuzzy matching
         if committee_name:
-            normalized = re.sub(r"\s+", "", committee_name)
-            filtered = []
-            for row in rows:
-                row_name = re.sub(r"\s+", "", str(row.get("COMMITTEE_NAME", "")))
-                if normalized in row_name:
-                    filtered.append(row)
+            normalized = _strip_whitespace(committee_name)
+            filtered = [row for row in rows if normalized in _strip_whitespace(str(row.get("COMMITTEE_NAME", "")))]
 
             # CRITICAL FIX: If filtering yields results, use them.
             # If filtering yields NOTHING, it means the name didn't match.
@@ -2,15 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
+from pydantic import TypeAdapter
+
 from assemblymcp.models import (
+    Bill,
     CommitteeVotingStats,
     CommitteeWorkSummary,
     LegislativeReport,
     MemberActivityReport,
     TopicVotingStats,
 )
+from assemblymcp.services import _get_data_with_retry, _iter_rows, _parse_date_text
 
 if TYPE_CHECKING:
     from assemblymcp.services import BillService, MeetingService, MemberService
@@ -39,6 +48,36 @@ COMMITTEE_ALIASES = {
     "예결위": "예산결산특별위원회",
 }
 
+# Full committee names; only these are safe to pass upstream as an exact CURR_COMMITTEE filter
+_CANONICAL_COMMITTEE_NAMES = frozenset(COMMITTEE_ALIASES.values())
+
+# Validates a whole batch of report rows in one call instead of constructing models one by one
+_REPORT_LIST_ADAPTER = TypeAdapter(list[LegislativeReport])
+
+# Processing statuses that indicate a bill reached a plenary vote
+_TRENDABLE_STATUSES = frozenset({"의결", "본회의 심의"})
+
+
+def _is_passed_status(status: str | None) -> bool:
+    """True for a processing status that records a passed (and not discarded) bill."""
+    return bool(status) and "가결" in status and "폐기" not in status
+
+
+def _year_month(text: str) -> tuple[int, int]:
+    """Parse the year and month of a 'YYYY.MM.DD' career date; raises ValueError when malformed."""
+    year, month, day = text.strip().split(".")
+    # Like strptime("%Y.%m.%d"): a four-digit year and a real calendar day are required
+    if len(year) != 4:
+        raise ValueError(f"invalid year in {text!r}")
+    parsed = date(int(year), int(month), int(day))
+    return parsed.year, parsed.month
+
+
+@lru_cache(maxsize=512)
+def _normalize_committee_name(name: str) -> str:
+    clean_name = name.strip().replace(" ", "")
+    return COMMITTEE_ALIASES.get(clean_name, clean_name)
+
 
 class SmartService:
     def __init__(
@@ -47,43 +86,38 @@ class SmartService:
         meeting_service: MeetingService,
         member_service: MemberService,
     ):
+        # The services should share one AssemblyAPIClient (as server.py wires them) so every fan-out
+        # reuses the same pooled, keep-alive httpx connections instead of opening its own.
         self.bill_service = bill_service
         self.meeting_service = meeting_service
         self.member_service = member_service
 
     def _normalize_committee_name(self, name: str) -> str:
-        clean_name = name.strip().replace(" ", "")
-        return COMMITTEE_ALIASES.get(clean_name, clean_name)
+        return _normalize_committee_name(name)
 
     async def get_legislative_reports(self, keyword: str, limit: int = 5) -> list[LegislativeReport]:
-        import json
-
-        from assemblymcp.services import _collect_rows
-
-        reports = []
+        """
+        Fetch NABO reports and 국회뉴스ON articles for a keyword.
+        Both go through _get_data_with_retry, so identical concurrent lookups share one request and,
+        when caching is enabled, successful responses are reused. A failed source is never cached.
+        """
 
         async def fetch_nabo():
             try:
-                raw_data = await self.bill_service.client.get_data(
-                    "OB5IBW001180FQ10640", params={"SUBJECT": keyword, "pSize": limit}
+                raw_data = await _get_data_with_retry(
+                    self.bill_service.client, "OB5IBW001180FQ10640", {"SUBJECT": keyword, "pSize": limit}
                 )
-                if isinstance(raw_data, str):
-                    raw_data = json.loads(raw_data)
-
-                rows = _collect_rows(raw_data)
-                return (
+                return _REPORT_LIST_ADAPTER.validate_python(
                     [
-                        LegislativeReport(
-                            source="국회예산정책처 (NABO)",
-                            title=item.get("SUBJECT", ""),
-                            date=item.get("REG_DATE", "")[:10] if item.get("REG_DATE") else None,
-                            link=item.get("LINK_URL"),
-                            report_type="분석보고서",
-                        )
-                        for item in rows
+                        {
+                            "source": "국회예산정책처 (NABO)",
+                            "title": item.get("SUBJECT", ""),
+                            "date": item.get("REG_DATE", "")[:10] if item.get("REG_DATE") else None,
+                            "link": item.get("LINK_URL"),
+                            "report_type": "분석보고서",
+                        }
+                        for item in _iter_rows(raw_data)
                     ]
-                    if rows
-                    else []
                 )
             except Exception as e:
                 logger.warning(f"NABO 보고서 조회 중 오류 발생 (키워드: '{keyword}'): {e}")
@@ -91,36 +125,27 @@ class SmartService:
 
         async def fetch_news():
             try:
-                raw_data = await self.bill_service.client.get_data(
-                    "O5MSQF0009823A15643", params={"V_TITLE": keyword, "pSize": limit}
+                raw_data = await _get_data_with_retry(
+                    self.bill_service.client, "O5MSQF0009823A15643", {"V_TITLE": keyword, "pSize": limit}
                 )
-                if isinstance(raw_data, str):
-                    raw_data = json.loads(raw_data)
-
-                rows = _collect_rows(raw_data)
-                return (
+                return _REPORT_LIST_ADAPTER.validate_python(
                     [
-                        LegislativeReport(
-                            source="국회뉴스ON",
-                            title=item.get("V_TITLE", ""),
-                            date=item.get("DATE_RELEASED", "")[:10] if item.get("DATE_RELEASED") else None,
-                            link=item.get("URL_LINK"),
-                            report_type="뉴스/브리핑",
-                        )
-                        for item in rows
+                        {
+                            "source": "국회뉴스ON",
+                            "title": item.get("V_TITLE", ""),
+                            "date": item.get("DATE_RELEASED", "")[:10] if item.get("DATE_RELEASED") else None,
+                            "link": item.get("URL_LINK"),
+                            "report_type": "뉴스/브리핑",
+                        }
+                        for item in _iter_rows(raw_data)
                     ]
-                    if rows
-                    else []
                 )
             except Exception as e:
                 logger.warning(f"국회뉴스ON 조회 중 오류 발생 (키워드: '{keyword}'): {e}")
                 return []
 
         results = await asyncio.gather(fetch_nabo(), fetch_news())
-        for res_list in results:
-            reports.extend(res_list)
-
-        return reports[: limit * 2]
+        return list(islice(chain.from_iterable(results), limit * 2))
 
     async def get_committee_work_summary(self, committee_name: str) -> CommitteeWorkSummary:
         normalized_target = self._normalize_committee_name(committee_name)
@@ -129,9 +154,7 @@ class SmartService:
 
         bills, reports = await asyncio.gather(bills_task, reports_task)
 
-        relevant_bills = [
-            b for b in bills if normalized_target in self._normalize_committee_name(b.CURR_COMMITTEE or "")
-        ]
+        relevant_bills = [b for b in bills if normalized_target in _normalize_committee_name(b.CURR_COMMITTEE or "")]
 
         return CommitteeWorkSummary(
             committee_name=normalized_target, pending_bills_sample=relevant_bills[:5], related_reports=reports
@@ -141,27 +164,35 @@ class SmartService:
         normalized_name = self._normalize_committee_name(committee_name)
         chair_name = normalized_name + "장"
 
-        relevant_bills = []
-        target_age = "22"
-        for age in ["22", "21"]:
-            target_age = age
-            bills = await self.bill_service.get_bill_info(age=age, limit=500)
-            relevant_bills = [
+        def select_passed_committee_bills(bills: list[Bill]) -> list[Bill]:
+            return [
                 b
                 for b in bills
-                if (normalized_name in (b.CURR_COMMITTEE or "") or chair_name in (b.CURR_COMMITTEE or ""))
-                and ("가결" in (b.PROC_STATUS or ""))
-                and ("폐기" not in (b.PROC_STATUS or ""))
+                if _is_passed_status(b.PROC_STATUS)
+                and (committee := b.CURR_COMMITTEE)
+                and (normalized_name in committee or chair_name in committee)
             ]
-            if relevant_bills:
-                break
+
+        # A full committee name can also narrow the search upstream. Partial names (e.g. "정무") only work
+        # with the local substring filter, and the page stays at 500 in case the API ignores CURR_COMMITTEE.
+        filters: dict[str, Any] = {"limit": 500}
+        if normalized_name in _CANONICAL_COMMITTEE_NAMES:
+            filters["committee"] = normalized_name
+        target_age, relevant_bills = await self.bill_service.get_bill_info_current_first(
+            select=select_passed_committee_bills, **filters
+        )
 
         passed_analysis = []
         total_yes_rate = 0.0
         valid_vote_count = 0
 
-        for bill in relevant_bills[:10]:
-            summary = await self.bill_service.get_bill_voting_summary(bill.BILL_ID, age=target_age)
+        # Fetch the voting summaries concurrently; a bill whose lookup fails is skipped rather than failing the stats
+        sample_bills = relevant_bills[:10]
+        summaries = await self.bill_service.get_bill_voting_summaries(
+            [bill.BILL_ID for bill in sample_bills], age=target_age
+        )
+
+        for bill, summary in zip(sample_bills, summaries, strict=True):
             if summary and summary.VOTE_TCNT and summary.VOTE_TCNT > 0:
                 yes_rate = (summary.YES_TCNT / summary.VOTE_TCNT) * 100
                 total_yes_rate += yes_rate
@@ -186,32 +217,34 @@ class SmartService:
         )
 
     async def get_topic_voting_stats(self, keyword: str, limit: int = 10) -> TopicVotingStats:
-        target_age = "22"
-        passed_bills = []
-        for age in ["22", "21"]:
-            target_age = age
-            bills = await self.bill_service.get_bill_info(age=age, bill_name=keyword, limit=100)
-            passed_bills = [
-                b for b in bills if ("가결" in (b.PROC_STATUS or "")) and ("폐기" not in (b.PROC_STATUS or ""))
-            ]
-            if passed_bills:
-                break
+        def select_passed_bills(bills: list[Bill]) -> list[Bill]:
+            return [b for b in bills if _is_passed_status(b.PROC_STATUS)]
+
+        target_age, passed_bills = await self.bill_service.get_bill_info_current_first(
+            select=select_passed_bills, bill_name=keyword, limit=100
+        )
+
+        # Fetch the voting summaries concurrently; a bill whose lookup fails is skipped rather than failing the stats
+        sample_bills = passed_bills[:limit]
+        summaries = await self.bill_service.get_bill_voting_summaries([b.BILL_ID for b in sample_bills], age=target_age)
 
         voting_results = []
-        for b in passed_bills[:limit]:
-            summary = await self.bill_service.get_bill_voting_summary(b.BILL_ID, age=target_age)
+        total_yes_rate = 0.0
+        for b, summary in zip(sample_bills, summaries, strict=True):
             if summary and summary.VOTE_TCNT and summary.VOTE_TCNT > 0:
-                yes_rate = (summary.YES_TCNT / summary.VOTE_TCNT) * 100
+                # The topic average is taken over the rounded per-bill rates
+                yes_rate = round((summary.YES_TCNT / summary.VOTE_TCNT) * 100, 2)
+                total_yes_rate += yes_rate
                 voting_results.append(
                     {
                         "BILL_NAME": b.BILL_NAME,
-                        "YES_RATE": round(yes_rate, 2),
+                        "YES_RATE": yes_rate,
                         "VOTE_DATE": summary.PROC_DT,
                         "TOTAL_VOTES": summary.VOTE_TCNT,
                     }
                 )
 
-        avg_score = sum(b["YES_RATE"] for b in voting_results) / len(voting_results) if voting_results else 0.0
+        avg_score = total_yes_rate / len(voting_results) if voting_results else 0.0
 
         return TopicVotingStats(
             keyword=keyword,
@@ -222,8 +255,10 @@ class SmartService:
         )
 
     async def get_bill_history(self, bill_id: str) -> list[dict[str, Any]]:
-        details = await self.bill_service.get_bill_details(bill_id)
-        meetings = await self.meeting_service.get_meeting_records(bill_id)
+        details, meetings = await asyncio.gather(
+            self.bill_service.get_bill_details(bill_id),
+            self.meeting_service.get_meeting_records(bill_id),
+        )
         history = []
         if not details:
             return []
@@ -243,8 +278,9 @@ class SmartService:
 
         for m in meetings:
             m_date = m.get("CONF_DATE")
-            if m_date and len(m_date) == 8:
-                m_date = f"{m_date[:4]}-{m_date[4:6]}-{m_date[6:]}"
+            # Normalize to YYYY-MM-DD like the bill dates so the string sort below is chronological
+            if m_date and (iso_date := _parse_date_text(str(m_date).strip())):
+                m_date = iso_date
             history.append(
                 {
                     "date": m_date or "날짜 미상",
@@ -253,7 +289,7 @@ class SmartService:
                 }
             )
 
-        history.sort(key=lambda x: x["date"] if x["date"] else "")
+        history.sort(key=itemgetter("date"))
         return history
 
     async def analyze_legislative_issue(self, topic: str, limit: int = 5) -> dict[str, Any]:
@@ -262,26 +298,26 @@ class SmartService:
             return {"topic": topic, "message": "데이터 없음"}
 
         main_bill = bills[0]
-        details = await self.bill_service.get_bill_details(main_bill.BILL_ID)
-        meetings = await self.meeting_service.get_meeting_records(main_bill.BILL_ID)
-
-        proposers = []
-        seen = set()
-        for b in bills[:3]:
-            if b.PRIMARY_PROPOSER and b.PRIMARY_PROPOSER not in seen:
-                info = await self.member_service.get_member_info(b.PRIMARY_PROPOSER)
-                if info:
-                    proposers.append(info[0])
-                    seen.add(b.PRIMARY_PROPOSER)
+        # Unique lead proposers of the top bills, in order
+        proposer_names = list(dict.fromkeys(b.PRIMARY_PROPOSER for b in bills[:3] if b.PRIMARY_PROPOSER))
+
+        details, meetings, *infos = await asyncio.gather(
+            self.bill_service.get_bill_details(main_bill.BILL_ID),
+            self.meeting_service.get_meeting_records(main_bill.BILL_ID),
+            *(self.member_service.get_member_info(name) for name in proposer_names),
+        )
+        proposers = [info[0] for info in infos if info]
+        # main_bill is bills[0], so its dump is reused rather than serialized twice
+        recent_bills = [b.model_dump(exclude_none=True) for b in bills]
 
         return {
             "topic": topic,
             "summary": {
                 "total_bills_found": len(bills),
-                "latest_bill": main_bill.model_dump(exclude_none=True),
+                "latest_bill": recent_bills[0],
                 "key_discussion_points": details.MAJOR_CONTENT if details else None,
             },
-            "recent_bills": [b.model_dump(exclude_none=True) for b in bills],
+            "recent_bills": recent_bills,
             "relevant_meetings": meetings[:3] if meetings else [],
             "key_politicians": proposers,
         }
@@ -296,26 +332,22 @@ class SmartService:
         basic_info = infos[0] if infos else {"HG_NM": member_name}
 
         committee_durations = {}
+        today = date.today()
         for c in careers:
-            if not c.FRTO_DATE or "~" not in c.FRTO_DATE:
+            start, sep, end = (c.FRTO_DATE or "").partition("~")
+            if not sep:
                 continue
 
-            dates = c.FRTO_DATE.split("~")
             try:
-                from datetime import datetime
-
-                start_dt = datetime.strptime(dates[0].strip(), "%Y.%m.%d")
-                end_dt = (
-                    datetime.strptime(dates[1].strip(), "%Y.%m.%d")
-                    if len(dates) > 1 and dates[1].strip()
-                    else datetime.now()
-                )
-                months = (end_dt.year - start_dt.year) * 12 + (end_dt.month - start_dt.month)
+                start_year, start_month = _year_month(start)
+                # An open-ended term ("2024.06.10 ~") runs to today
+                end_year, end_month = _year_month(end) if end.strip() else (today.year, today.month)
+                months = (end_year - start_year) * 12 + (end_month - start_month)
                 committee_durations[c.PROFILE_SJ] = committee_durations.get(c.PROFILE_SJ, 0) + max(1, months)
-            except Exception:
+            except ValueError:
                 continue
 
-        sorted_expert = sorted(committee_durations.items(), key=lambda x: x[1], reverse=True)
+        sorted_expert = sorted(committee_durations.items(), key=itemgetter(1), reverse=True)
         summary_stats = {
             "total_bills_22nd": len(bills),
             "expertise": [f"{name}({m}개월)" for name, m in sorted_expert[:3]],
@@ -332,30 +364,35 @@ class SmartService:
         )
 
     async def get_bill_voting_results(self, bill_id: str) -> dict[str, Any]:
-        summary = await self.bill_service.get_bill_voting_summary(bill_id)
+        # Both lookups only need the bill ID, so start the per-member records alongside the summary
+        records_task = asyncio.create_task(self.bill_service.get_member_voting_history(bill_id=bill_id, limit=100))
+        try:
+            summary = await self.bill_service.get_bill_voting_summary(bill_id)
+        except BaseException:
+            records_task.cancel()
+            raise
         if not summary:
+            # Unvoted bill: don't wait on (or retry) a records lookup that won't be reported
+            records_task.cancel()
             return {"bill_id": bill_id, "message": "데이터 없음"}
-        records = await self.bill_service.get_member_voting_history(bill_id=bill_id, limit=100)
-        party_stats = {}
+        records = await records_task
+        party_stats: defaultdict[str, dict[str, int]] = defaultdict(lambda: {"찬성": 0, "반대": 0, "기권": 0})
         for r in records:
-            p = r.POLY_NM or "무소속"
-            if p not in party_stats:
-                party_stats[p] = {"찬성": 0, "반대": 0, "기권": 0}
-
-            if "찬성" in r.RESULT_VOTE_MOD:
-                party_stats[p]["찬성"] += 1
-            elif "반대" in r.RESULT_VOTE_MOD:
-                party_stats[p]["반대"] += 1
-            elif "기권" in r.RESULT_VOTE_MOD:
-                party_stats[p]["기권"] += 1
-        return {"voting_summary": summary.model_dump(exclude_none=True), "party_trend_sample": party_stats}
+            counts = party_stats[r.POLY_NM or "무소속"]
+            vote = r.RESULT_VOTE_MOD
+            if "찬성" in vote:
+                counts["찬성"] += 1
+            elif "반대" in vote:
+                counts["반대"] += 1
+            elif "기권" in vote:
+                counts["기권"] += 1
+        return {"voting_summary": summary.model_dump(exclude_none=True), "party_trend_sample": dict(party_stats)}
 
     async def analyze_voting_trends(self, topic: str) -> dict[str, Any]:
         bills = await self.bill_service.search_bills(keyword=topic, limit=10)
-        results = []
-        for b in bills:
-            if b.PROC_STATUS in ["의결", "본회의 심의"]:
-                summary = await self.bill_service.get_bill_voting_summary(b.BILL_ID)
-                if summary:
-                    results.append(summary.model_dump(exclude_none=True))
+        candidates = [b for b in bills if b.PROC_STATUS in _TRENDABLE_STATUSES]
+
+        # Fetch the voting summaries concurrently; failed lookups are skipped like missing ones
+        summaries = await self.bill_service.get_bill_voting_summaries([b.BILL_ID for b in candidates])
+        results = [summary.model_dump(exclude_none=True) for summary in summaries if summary]
         return {"topic": topic, "analyzed_count": len(results), "voting_summaries": results}
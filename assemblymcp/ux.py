@@ -24,6 +24,9 @@ PUBLIC_WORKFLOW_TOOLS = [
     "watch_action_plan",
 ]
 
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
 ENTITY_ALIASES = {
     "bill": "bill",
     "law": "bill",
@@ -80,7 +83,8 @@ def failure_marker(
 
 def normalize_text(value: Any) -> str:
     """Normalize text for exact-ish comparisons without losing Korean content."""
-    return re.sub(r"\s+", "", str(value or "")).casefold()
+    # split()/join drops the same whitespace as re.sub(r"\s+", "") without the regex engine
+    return "".join(str(value or "").split()).casefold()
 
 
 def normalize_claim_type(value: Any) -> str:
@@ -95,9 +99,9 @@ def normalize_date(value: Any) -> str | None:
     candidate = str(value).strip()
     if not candidate:
         return None
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", candidate):
+    if _ISO_DATE_RE.fullmatch(candidate):
         return candidate
-    digits = re.sub(r"[^0-9]", "", candidate)
+    digits = _NON_DIGIT_RE.sub("", candidate)
     if len(digits) == 8:
         return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
     return candidate
@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from assemblymcp.config import settings
 from assemblymcp.models import Bill
 from assemblymcp.services import BillService
 
@@ -57,6 +58,22 @@ async def test_get_bill_info_success(bill_service, mock_client):
     assert bills == []
 
 
+@pytest.mark.asyncio
+async def test_get_bill_info_skips_malformed_rows_within_limit(bill_service, mock_client):
+    mock_client.get_data = AsyncMock(
+        return_value=[
+            {"BILL_ID": "PRC_1", "BILL_NAME": "First"},
+            "not a row",
+            {"BILL_ID": "PRC_2", "BILL_NAME": "Second"},
+            {"BILL_ID": "PRC_3", "BILL_NAME": "Third"},
+        ]
+    )
+
+    bills = await bill_service.get_bill_info(age="22", limit=2)
+
+    assert [b.BILL_ID for b in bills] == ["PRC_1", "PRC_2"]
+
+
 @pytest.mark.asyncio
 async def test_search_bills_fallback(bill_service, mock_client):
     async def side_effect(service_id_or_name, params, **kwargs):
@@ -82,6 +99,18 @@ async def test_search_bills_fallback(bill_service, mock_client):
     assert mock_client.get_data.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_search_bills_prefers_current_session(bill_service, mock_client):
+    async def side_effect(service_id_or_name, params, **kwargs):
+        return [{"BILL_ID": f"PRC_{params['AGE']}", "BILL_NAME": f"Bill {params['AGE']}"}]
+
+    mock_client.get_data = AsyncMock(side_effect=side_effect)
+
+    bills = await bill_service.search_bills("keyword")
+
+    assert [b.BILL_ID for b in bills] == ["PRC_22"]
+
+
 @pytest.mark.asyncio
 async def test_get_recent_bills_sorting(bill_service, mock_client):
     mock_client.get_data = AsyncMock(
@@ -131,6 +160,26 @@ async def test_get_bill_details(bill_service, mock_client):
     assert detail.PROPOSE_REASON == "This is the reason."
 
 
+@pytest.mark.asyncio
+async def test_get_bill_details_falls_back_to_previous_session(bill_service, mock_client):
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.BILL_SEARCH_ID:
+            if params.get("AGE") != "21":
+                return []
+            return [{"BILL_ID": "PRC_OLD", "BILL_NO": "2100001", "BILL_NAME": "Old Bill"}]
+        if service_id_or_name == bill_service.BILL_DETAIL_ID:
+            return [{"MAIN_CNTS": "Summary", "RSON_CONT": "Reason"}]
+        return []
+
+    mock_client.get_data = AsyncMock(side_effect=side_effect)
+
+    detail = await bill_service.get_bill_details("PRC_OLD")
+
+    assert detail is not None
+    assert detail.BILL_NAME == "Old Bill"
+    assert detail.MAJOR_CONTENT == "Summary"
+
+
 @pytest.mark.asyncio
 async def test_bill_model_captures_both_ids(bill_service, mock_client):
     """Test that Bill model captures both BILL_ID and BILL_NO separately."""
@@ -203,3 +252,110 @@ async def test_get_bill_details_uses_bill_no(bill_service, mock_client):
 
     assert "BILL_NO" in call_params
     assert call_params["BILL_NO"] == "9999999"
+
+
+def test_build_bill_search_schema_fast_path_matches_generic_path(bill_service):
+    """Rows in the canonical search schema must build the same Bill as the alias-aware path."""
+    search_row = {
+        "BILL_ID": "PRC_FAST1",
+        "BILL_NO": 2200123,
+        "AGE": 22,
+        "BILL_NAME": " 빠른 경로 법안 ",
+        "PROPOSER": "홍길동의원 등 10인",
+        "PROPOSER_KIND": "의원",
+        "PROPOSE_DT": "2024-06-01",
+        "CURR_COMMITTEE_ID": "9700006",
+        "CURR_COMMITTEE": "법제사법위원회",
+        "COMMITTEE_DT": "20240603",
+        "LINK_URL": "http://test.com",
+        "RST_PROPOSER": "홍길동",
+        "RST_MONA_CD": "ABC123",
+        "PROC_RESULT_CD": None,
+        "PROC_DT": None,
+    }
+    legacy_row = {k: v for k, v in search_row.items() if k not in ("CURR_COMMITTEE_ID", "RST_MONA_CD")}
+
+    fast = bill_service._build_bill(search_row)
+    generic = bill_service._build_bill(legacy_row)
+
+    assert fast == generic
+    assert fast.BILL_NO == "2200123"
+    assert fast.BILL_NAME == "빠른 경로 법안"
+    assert fast.PRIMARY_PROPOSER == "홍길동"
+    assert fast.PROPOSER_COUNT == 11
+    assert fast.PROPOSE_DT == "2024-06-01"
+    assert fast.PROC_STATUS == ""
+
+    search_row["PROC_RESULT_CD"] = "원안가결"
+    assert bill_service._build_bill(search_row).PROC_STATUS == "원안가결"
+
+
+@pytest.mark.asyncio
+async def test_get_bill_info_reuses_cached_results(bill_service, mock_client, monkeypatch):
+    """Identical searches within the TTL should hit the upstream API only once."""
+    monkeypatch.setattr(settings, "enable_caching", True)
+    mock_client.get_data = AsyncMock(
+        return_value=[
+            {"BILL_ID": "1", "BILL_NAME": "Old", "PROPOSE_DT": "20230101", "LINK_URL": "x"},
+            {"BILL_ID": "2", "BILL_NAME": "New", "PROPOSE_DT": "20231231", "LINK_URL": "x"},
+        ]
+    )
+
+    first = await bill_service.get_bill_info(age="22", bill_name="AI")
+    first.reverse()
+    second = await bill_service.get_bill_info(age="22", bill_name="AI")
+
+    assert mock_client.get_data.call_count == 1
+    assert [b.BILL_ID for b in second] == ["1", "2"]
+
+    await bill_service.get_bill_info(age="21", bill_name="AI")
+    assert mock_client.get_data.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (20240105, "2024-01-05"),
+        (20240105.0, "2024-01-05"),
+        (" 20240105 ", "2024-01-05"),
+        ("2024-01-05", "2024-01-05"),
+        ("2024/01/05", "2024-01-05"),
+        ("2024.01.05", "2024-01-05"),
+        ("2024-1-05", "2024-01-05"),
+        ("2024-02-30", None),
+        ("2024년 01월 05일", "2024-01-05"),
+        ("20241305", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_date_formats(bill_service, value, expected):
+    assert bill_service._parse_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("홍길동의원 등 10인", ("홍길동", 11)),
+        ("홍길동 외 2명", ("홍길동", 3)),
+        ("국회의장", ("국회의장", None)),
+        ("외교통일위원장", ("외교통일위원장", None)),
+        ("  ", (None, None)),
+    ],
+)
+def test_extract_proposer_info(bill_service, raw, expected):
+    assert bill_service._extract_proposer_info(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("row", "expected"),
+    [
+        ({"PROC_RESULT_CD": "1000"}, "접수"),
+        ({"PROC_RESULT_CD": 5000}, "폐기"),
+        ({"PROC_STATUS_CD": "9999"}, "9999"),
+        ({"PROC_STATUS": "원안가결", "PROC_RESULT_CD": "1000"}, "원안가결"),
+        ({}, ""),
+    ],
+)
+def test_normalize_proc_status(bill_service, row, expected):
+    assert bill_service._normalize_proc_status(row) == expected
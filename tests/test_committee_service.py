@@ -55,6 +55,21 @@ async def test_get_committee_list(committee_service, mock_client):
     assert call_args.kwargs["params"] == {}
 
 
+@pytest.mark.asyncio
+async def test_get_committee_list_skips_malformed_rows(committee_service, mock_client):
+    mock_client.get_data = AsyncMock(
+        return_value=[
+            {"HR_DEPT_CD": "9700008", "COMMITTEE_NAME": "법제사법위원회", "CURR_CNT": "18"},
+            {"HR_DEPT_CD": "9700009", "COMMITTEE_NAME": "정무위원회", "CURR_CNT": "미정"},
+            {"HR_DEPT_CD": "9700010", "COMMITTEE_NAME": "기획재정위원회", "CURR_CNT": "26"},
+        ]
+    )
+
+    committees = await committee_service.get_committee_list()
+
+    assert [c.HR_DEPT_CD for c in committees] == ["9700008", "9700010"]
+
+
 @pytest.mark.asyncio
 async def test_get_committee_list_filter(committee_service, mock_client):
     mock_client.get_data = AsyncMock(return_value=[])
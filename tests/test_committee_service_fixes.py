@@ -66,6 +66,28 @@ async def test_get_committee_members_filters_incorrect_codes_with_dept_cd_key(co
     assert rows[0]["HG_NM"] == "Target Member"
 
 
+@pytest.mark.asyncio
+async def test_get_committee_members_filters_by_code_and_name(committee_service, mock_client):
+    """
+    Test that code and name filters are both applied when both are given.
+    """
+    target_code = "9700006"
+
+    mock_client.get_data = AsyncMock(
+        return_value=[
+            {"COMMITTEE_NAME": "법제사법위원회", "HR_DEPT_CD": target_code, "HG_NM": "Target Member"},
+            {"COMMITTEE_NAME": "법제사법위원회", "HR_DEPT_CD": "9700005", "HG_NM": "Wrong Code"},
+            {"COMMITTEE_NAME": "국회운영위원회", "HR_DEPT_CD": target_code, "HG_NM": "Wrong Name"},
+        ]
+    )
+
+    rows = await committee_service.get_committee_members(committee_code=target_code, committee_name="법제 사법")
+    assert [r["HG_NM"] for r in rows] == ["Target Member"]
+
+    rows = await committee_service.get_committee_members(committee_code=target_code, committee_name="교육위원회")
+    assert rows == []
+
+
 @pytest.mark.asyncio
 async def test_get_committee_members_empty_result_handling(committee_service, mock_client):
     """
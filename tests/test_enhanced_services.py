@@ -60,39 +60,39 @@ async def test_search_bills_enhanced(bill_service, mock_client):
 
 @pytest.mark.asyncio
 async def test_smart_service_analyze(smart_service, mock_client):
-    mock_client.get_data.side_effect = [
-        # search_bills
-        [
-            {
-                "BILL_ID": "PRC_1",
-                "BILL_NAME": "AI 법안",
-                "PROPOSER": "김철수",
-                "PROPOSER_KIND": "의원",
-                "PROC_STATUS": "접수",
-                "CURR_COMMITTEE": "과방위",
-            }
-        ],
-        # get_bill_details (basic info probe)
-        [
-            {
-                "BILL_ID": "PRC_1",
-                "BILL_NAME": "AI 법안",
-                "PROPOSER": "김철수",
-                "PROPOSER_KIND": "의원",
-                "PROC_STATUS": "접수",
-                "CURR_COMMITTEE": "과방위",
-            }
-        ],
-        # get_bill_details (detail)
-        [{"MAIN_CNTS": "AI 진흥 내용", "RSON_CONT": "필요성"}],
+    bill_row = {
+        "BILL_ID": "PRC_1",
+        "BILL_NAME": "AI 법안",
+        "PROPOSER": "김철수",
+        "PROPOSER_KIND": "의원",
+        "PROC_STATUS": "접수",
+        "CURR_COMMITTEE": "과방위",
+    }
+
+    # search_bills queries both sessions concurrently, so answer by request rather than call order
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == smart_service.bill_service.BILL_SEARCH_ID:
+            # search_bills / get_bill_details (basic info probe); only the 22nd session has the bill
+            return [bill_row, {**bill_row, "BILL_ID": "PRC_2"}] if params.get("AGE") == "22" else []
+        if service_id_or_name == smart_service.bill_service.BILL_DETAIL_ID:
+            return [{"MAIN_CNTS": "AI 진흥 내용", "RSON_CONT": "필요성"}]
+        if service_id_or_name == smart_service.member_service.MEMBER_INFO_ID:
+            return [{"HG_NM": "김철수", "POLY_NM": "국민의힘"}]
         # get_meeting_records
-        [{"CONF_TITLE": "1차 회의"}],
-        # get_member_info
-        [{"HG_NM": "김철수", "POLY_NM": "국민의힘"}],
-    ]
+        return [{"CONF_TITLE": "1차 회의"}]
+
+    mock_client.get_data.side_effect = side_effect
 
     report = await smart_service.analyze_legislative_issue("AI")
     assert report["topic"] == "AI"
     assert len(report["recent_bills"]) > 0
     assert report["summary"]["latest_bill"]["BILL_ID"] == "PRC_1"
     assert report["summary"]["key_discussion_points"] == "AI 진흥 내용"
+    # Both bills share a proposer, who is looked up once
+    assert [p["HG_NM"] for p in report["key_politicians"]] == ["김철수"]
+    member_calls = [
+        c
+        for c in mock_client.get_data.call_args_list
+        if c.kwargs["service_id_or_name"] == smart_service.member_service.MEMBER_INFO_ID
+    ]
+    assert len(member_calls) == 1
@@ -83,3 +83,56 @@ async def test_search_meetings_by_date_range(meeting_service, mock_client):
     call_args = mock_client.get_data.call_args
     assert call_args.kwargs["service_id_or_name"] == "O27DU0000960M511942"
     assert "CONF_DATE" not in call_args.kwargs["params"]
+
+
+@pytest.mark.asyncio
+async def test_search_meetings_returns_newest_within_limit(meeting_service, mock_client):
+    mock_client.get_data = AsyncMock(
+        return_value=[
+            {"MEETING_DATE": "2024-11-10", "TITLE": "A"},
+            {"MEETING_DATE": "2024-11-20", "TITLE": "B"},
+            {"MEETING_DATE": "2024-11-15", "TITLE": "C"},
+            {"MEETING_DATE": "2024-11-20", "TITLE": "D"},
+        ]
+    )
+
+    meetings = await meeting_service.search_meetings(limit=3)
+
+    # Ties keep the API order, matching a stable descending sort
+    assert [m["CONF_TITLE"] for m in meetings] == ["B", "D", "C"]
+    assert meetings[0]["CONF_DATE"] == "20241120"
+
+
+@pytest.mark.asyncio
+async def test_search_meetings_date_window_is_inclusive(meeting_service, mock_client):
+    mock_client.get_data = AsyncMock(
+        return_value=[
+            {"MEETING_DATE": "2024-11-30", "TITLE": "after"},
+            {"MEETING_DATE": "2024-11-10", "TITLE": "start"},
+            {"MEETING_DATE": "2024-11-20", "TITLE": "end"},
+            {"MEETING_DATE": "2024-11-01", "TITLE": "before"},
+            {"MEETING_DATE": "2024-11-15", "TITLE": "middle"},
+        ]
+    )
+
+    meetings = await meeting_service.search_meetings(date_start="2024-11-10", date_end="2024-11-20", limit=2)
+
+    assert [m["CONF_TITLE"] for m in meetings] == ["end", "middle"]
+
+
+@pytest.mark.asyncio
+async def test_search_meetings_tolerates_missing_dates(meeting_service, mock_client):
+    mock_client.get_data = AsyncMock(
+        return_value=[
+            {"MEETING_DATE": None, "TITLE": "undated"},
+            {"MEETING_DATE": "2024-11-20", "TITLE": "dated"},
+        ]
+    )
+
+    meetings = await meeting_service.search_meetings()
+
+    assert [(m["CONF_TITLE"], m["CONF_DATE"]) for m in meetings] == [("dated", "20241120"), ("undated", "")]
+
+    # Undated rows fall outside any date window
+    meetings = await meeting_service.search_meetings(date_start="2024-11-01")
+    assert [m["CONF_TITLE"] for m in meetings] == ["dated"]
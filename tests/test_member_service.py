@@ -23,6 +23,10 @@ async def test_member_info_filtering():
         assert len(results) == 1
         assert "홍 길 동" in results[0]["HG_NM"]
 
+        # 전각 공백(U+3000)이 포함된 검색어도 정규화
+        results = await service.get_member_info("홍\u3000길동")
+        assert len(results) == 1
+
         # 2. 검색 결과가 없는 경우 원본 반환 (기존 로직 유지 확인)
         results = await service.get_member_info("이영희")
         assert len(results) == 2
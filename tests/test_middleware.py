@@ -80,7 +80,7 @@ async def test_caching_middleware_non_cacheable():
     middleware = CachingMiddleware()
     settings.enable_caching = True
 
-    # Tool name doesn't start with get/search/list
+    # Tool name doesn't start with get/search/list/analyze
     context = create_mock_context(tool_name="do_something")
     mock_next = AsyncMock(return_value=create_mock_result("result"))
 
@@ -90,6 +90,21 @@ async def test_caching_middleware_non_cacheable():
     assert mock_next.call_count == 2  # Should be called twice
 
 
+@pytest.mark.asyncio
+async def test_caching_middleware_caches_analysis_tools():
+    middleware = CachingMiddleware()
+    settings.enable_caching = True
+
+    context = create_mock_context(tool_name="analyze_legislative_issue")
+    mock_next = AsyncMock(return_value=create_mock_result("analysis"))
+
+    await middleware.on_call_tool(context, mock_next)
+    result = await middleware.on_call_tool(context, mock_next)
+
+    assert result.content[0].text == "analysis"
+    assert mock_next.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_logging_middleware_handles_params_as_message(caplog):
     """Test LoggingMiddleware when context.message IS CallToolRequestParams."""
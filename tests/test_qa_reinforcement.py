@@ -66,6 +66,129 @@ async def test_api_retry_logic():
     assert mock_client.get_data.call_count == 3
 
 
+@pytest.mark.asyncio
+async def test_get_data_responses_cached_per_client(monkeypatch):
+    from assemblymcp.config import settings
+    from assemblymcp.services import _get_data_with_retry
+
+    monkeypatch.setattr(settings, "enable_caching", True)
+    client_a = MagicMock()
+    client_a.get_data = AsyncMock(return_value=[{"ROW": "A"}])
+    client_b = MagicMock()
+    client_b.get_data = AsyncMock(return_value=[{"ROW": "B"}])
+
+    assert await _get_data_with_retry(client_a, "CACHE_ID", {"AGE": "22", "pIndex": 1}) == [{"ROW": "A"}]
+    assert await _get_data_with_retry(client_a, "CACHE_ID", {"pIndex": 1, "AGE": "22"}) == [{"ROW": "A"}]
+    assert client_a.get_data.call_count == 1
+
+    # Another client never sees client_a's response
+    assert await _get_data_with_retry(client_b, "CACHE_ID", {"AGE": "22", "pIndex": 1}) == [{"ROW": "B"}]
+
+    # Unhashable params bypass the cache instead of failing
+    await _get_data_with_retry(client_a, "CACHE_ID", {"AGE": ["21", "22"]})
+    await _get_data_with_retry(client_a, "CACHE_ID", {"AGE": ["21", "22"]})
+    assert client_a.get_data.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_get_data_calls_share_one_fetch():
+    import asyncio
+
+    from assemblymcp.services import _get_data_with_retry
+
+    release = asyncio.Event()
+
+    async def slow_get_data(**kwargs):
+        await release.wait()
+        return [{"ROW": kwargs["params"]["AGE"]}]
+
+    mock_client = MagicMock()
+    mock_client.get_data = AsyncMock(side_effect=slow_get_data)
+
+    first = asyncio.create_task(_get_data_with_retry(mock_client, "INFLIGHT_ID", {"AGE": "22"}))
+    cancelled = asyncio.create_task(_get_data_with_retry(mock_client, "INFLIGHT_ID", {"AGE": "22"}))
+    other = asyncio.create_task(_get_data_with_retry(mock_client, "INFLIGHT_ID", {"AGE": "21"}))
+    await asyncio.sleep(0)
+
+    # Cancelling one waiter must not cancel the shared fetch
+    cancelled.cancel()
+    release.set()
+
+    assert await first == [{"ROW": "22"}]
+    assert await other == [{"ROW": "21"}]
+    assert mock_client.get_data.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_data_calls_are_bounded(monkeypatch):
+    import asyncio
+
+    from assemblymcp.config import settings
+    from assemblymcp.services import _get_data_with_retry
+
+    # The semaphore is created per event loop, so this test's loop picks up the patched limit
+    monkeypatch.setattr(settings, "max_concurrent_requests", 2)
+    active = peak = 0
+
+    async def slow_get_data(**kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return []
+
+    mock_client = MagicMock()
+    mock_client.get_data = AsyncMock(side_effect=slow_get_data)
+
+    await asyncio.gather(*(_get_data_with_retry(mock_client, "BOUNDED_ID", {"AGE": str(age)}) for age in range(6)))
+
+    assert mock_client.get_data.call_count == 6
+    assert peak == 2
+
+
+def test_max_concurrent_requests_rejects_zero(monkeypatch):
+    from pydantic import ValidationError
+
+    from assemblymcp.config import Settings
+
+    # A zero-sized semaphore would block every upstream call forever
+    monkeypatch.setenv("ASSEMBLY_MAX_CONCURRENT_REQUESTS", "0")
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+@pytest.mark.asyncio
+async def test_shared_get_data_fetch_cancelled_with_last_caller():
+    import asyncio
+
+    from assemblymcp.services import _get_data_with_retry, _inflight_requests
+
+    fetch_cancelled = asyncio.Event()
+
+    async def hanging_get_data(**kwargs):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            fetch_cancelled.set()
+            raise
+
+    mock_client = MagicMock()
+    mock_client.get_data = AsyncMock(side_effect=hanging_get_data)
+
+    callers = [asyncio.create_task(_get_data_with_retry(mock_client, "ORPHAN_ID", {"AGE": "22"})) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    # One remaining waiter keeps the shared fetch alive
+    callers[0].cancel()
+    await asyncio.sleep(0.01)
+    assert not fetch_cancelled.is_set()
+
+    callers[1].cancel()
+    await asyncio.wait_for(fetch_cancelled.wait(), timeout=1)
+    assert not any(key[1] == "ORPHAN_ID" for key in _inflight_requests)
+
+
 # 3. Server Tool Feedback Consistency Tests
 @pytest.mark.asyncio
 async def test_tool_empty_result_messages():
@@ -72,3 +72,14 @@ async def test_get_bill_voting_results_not_found():
         result = await get_bill_voting_results.fn(bill_id="NON_EXIST")
 
         assert result == {"message": "데이터 없음"}  # SmartService가 딕셔너리를 반환하는 경우
+
+
+def test_smart_service_shares_one_api_client():
+    from assemblymcp import server
+
+    if server.client is None:
+        pytest.skip("API client unavailable")
+
+    smart = server.smart_service
+    clients = {id(svc.client) for svc in (smart.bill_service, smart.meeting_service, smart.member_service)}
+    assert clients == {id(server.client)}
@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from assemblymcp.config import settings
 from assemblymcp.services import DiscoveryService
 
 # Sample service metadata for testing
@@ -39,6 +40,17 @@ async def test_list_services_all(discovery_service):
     assert results[1]["name"] == "Member Info"
 
 
+@pytest.mark.asyncio
+async def test_list_services_sorted_by_name(discovery_service, mock_client):
+    mock_client.service_metadata = {
+        "Z_ID": {"name": "Votes", "description": "", "category": "Bill"},
+        "A_ID": {"name": "Bills", "description": "", "category": "Bill"},
+        "M_ID": {"name": "Members", "description": "", "category": "Member"},
+    }
+    results = await discovery_service.list_services()
+    assert [r["name"] for r in results] == ["Bills", "Members", "Votes"]
+
+
 @pytest.mark.asyncio
 async def test_list_services_filter(discovery_service):
     results = await discovery_service.list_services(keyword="Member")
@@ -61,3 +73,33 @@ async def test_call_raw_success(discovery_service, mock_client):
 
     mock_client.get_data.assert_called_once_with(service_id_or_name="TEST_ID_1", params={"pSize": 5})
     assert result == [{"result": "success"}]
+
+
+@pytest.mark.asyncio
+async def test_get_preview_data_is_cached_per_service(discovery_service, mock_client, monkeypatch):
+    monkeypatch.setattr(settings, "enable_caching", True)
+    mock_client.get_data = AsyncMock(return_value=[{"UNIT_CD": "100022"}])
+
+    first = await discovery_service.get_preview_data("TEST_ID_1")
+    second = await discovery_service.get_preview_data("TEST_ID_1")
+
+    assert first == second == {"UNIT_CD": "100022"}
+    mock_client.get_data.assert_called_once()
+
+    await discovery_service.get_preview_data("TEST_ID_2")
+    assert mock_client.get_data.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_services_cache_follows_metadata_reload(discovery_service, mock_client):
+    first = await discovery_service.list_services(keyword="member")
+    first.clear()
+    again = await discovery_service.list_services(keyword="member")
+    assert [r["id"] for r in again] == ["TEST_ID_2"]
+
+    # ensure_master_list replaces the metadata dict; results must follow the new data
+    mock_client.service_metadata = {
+        "TEST_ID_3": {"name": "Member Careers", "description": "", "category": "Member"},
+    }
+    reloaded = await discovery_service.list_services(keyword="member")
+    assert [r["id"] for r in reloaded] == ["TEST_ID_3"]
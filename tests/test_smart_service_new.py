@@ -1,7 +1,9 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from assemblymcp.config import settings
 from assemblymcp.services import BillService, MeetingService, MemberService
 from assemblymcp.smart import SmartService
 
@@ -37,6 +39,45 @@ async def test_get_legislative_reports(smart_service, mock_client):
     assert reports[1].title == "뉴스1"
 
 
+@pytest.mark.asyncio
+async def test_get_legislative_reports_does_not_cache_failed_source(smart_service, mock_client, monkeypatch):
+    monkeypatch.setattr(settings, "enable_caching", True)
+    news_failures = [RuntimeError("news down")]
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if "SUBJECT" in params:
+            return [{"SUBJECT": "보고서1", "REG_DATE": "2024-01-01"}]
+        if news_failures:
+            raise news_failures.pop()
+        return [{"V_TITLE": "뉴스1", "DATE_RELEASED": "2024-01-02"}]
+
+    mock_client.get_data.side_effect = side_effect
+
+    # The failed news lookup is retried on the next call; the NABO rows come from the response cache
+    assert len(await smart_service.get_legislative_reports("AI")) == 1
+    assert len(await smart_service.get_legislative_reports("AI")) == 2
+    assert len(await smart_service.get_legislative_reports("AI")) == 2
+    assert mock_client.get_data.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_legislative_reports_coalesces_concurrent_calls(smart_service, mock_client):
+    release = asyncio.Event()
+
+    async def side_effect(*args, **kwargs):
+        await release.wait()
+        return []
+
+    mock_client.get_data.side_effect = side_effect
+
+    calls = [asyncio.create_task(smart_service.get_legislative_reports("AI")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*calls) == [[], [], []]
+    assert mock_client.get_data.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_committee_work_summary(smart_service, mock_client):
     mock_client.get_data.side_effect = [
@@ -66,22 +107,193 @@ async def test_get_committee_work_summary(smart_service, mock_client):
 
 @pytest.mark.asyncio
 async def test_analyze_committee_performance(smart_service, mock_client):
-    mock_client.get_data.side_effect = [
-        [],  # 22nd bills (empty)
-        [
-            {
-                "BILL_ID": "PRC_21_1",
-                "BILL_NAME": "가결법안",
-                "CURR_COMMITTEE": "법제사법위원회",
-                "PROC_STATUS": "원안가결",
-                "LINK_URL": "x",
-            }
-        ],  # 21st bills
-        [{"BILL_ID": "PRC_21_1", "VOTE_TCNT": 100, "YES_TCNT": 90, "PROC_RESULT_CD": "가결"}],  # Voting summary
-        [],  # Reports
-        [],  # News
-    ]
+    bill_service = smart_service.bill_service
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.BILL_SEARCH_ID:
+            if params["AGE"] == "22":
+                return []  # 22nd bills (empty)
+            return [
+                {
+                    "BILL_ID": "PRC_21_1",
+                    "BILL_NAME": "가결법안",
+                    "CURR_COMMITTEE": "법제사법위원회",
+                    "PROC_STATUS": "원안가결",
+                    "LINK_URL": "x",
+                }
+            ]  # 21st bills
+        if service_id_or_name == bill_service.VOTING_SUMMARY_ID:
+            return [{"BILL_ID": "PRC_21_1", "VOTE_TCNT": 100, "YES_TCNT": 90, "PROC_RESULT_CD": "가결"}]
+        return []
+
+    mock_client.get_data.side_effect = side_effect
 
     report = await smart_service.get_committee_voting_stats("법사위")
     assert report.committee_name == "법제사법위원회"
     assert report.avg_yes_rate == 90.0
+    assert report.assembly_age == "21"
+
+
+@pytest.mark.asyncio
+async def test_committee_voting_stats_skips_failed_summaries(smart_service, mock_client):
+    bill_service = smart_service.bill_service
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.BILL_SEARCH_ID:
+            if params["AGE"] != "22":
+                return []
+            return [
+                {
+                    "BILL_ID": f"PRC_{i}",
+                    "BILL_NAME": f"법안{i}",
+                    "CURR_COMMITTEE": "법제사법위원회",
+                    "PROC_STATUS": "원안가결",
+                }
+                for i in (1, 2, 3)
+            ]
+        if service_id_or_name == bill_service.VOTING_SUMMARY_ID:
+            if params["BILL_ID"] == "PRC_2":
+                raise ValueError("broken summary")
+            yes = 80 if params["BILL_ID"] == "PRC_1" else 60
+            return [{"BILL_ID": params["BILL_ID"], "VOTE_TCNT": 100, "YES_TCNT": yes}]
+        return []
+
+    mock_client.get_data.side_effect = side_effect
+
+    report = await smart_service.get_committee_voting_stats("법사위")
+
+    assert report.assembly_age == "22"
+    assert report.total_bills_analyzed == 2
+    assert [b["BILL_NAME"] for b in report.bills_detail] == ["법안1", "법안3"]
+    assert report.avg_yes_rate == 70.0
+    search_params = [
+        c.kwargs["params"]
+        for c in mock_client.get_data.call_args_list
+        if c.kwargs["service_id_or_name"] == bill_service.BILL_SEARCH_ID
+    ]
+    assert {p["CURR_COMMITTEE"] for p in search_params} == {"법제사법위원회"}
+
+
+@pytest.mark.asyncio
+async def test_committee_voting_stats_partial_name_filters_locally(smart_service, mock_client):
+    bill_service = smart_service.bill_service
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.BILL_SEARCH_ID:
+            if params["AGE"] != "22":
+                return []
+            return [
+                {
+                    "BILL_ID": "PRC_1",
+                    "BILL_NAME": "정무법안",
+                    "CURR_COMMITTEE": "정무위원회",
+                    "PROC_STATUS": "원안가결",
+                },
+                {
+                    "BILL_ID": "PRC_2",
+                    "BILL_NAME": "법사법안",
+                    "CURR_COMMITTEE": "법제사법위원회",
+                    "PROC_STATUS": "원안가결",
+                },
+            ]
+        if service_id_or_name == bill_service.VOTING_SUMMARY_ID:
+            return [{"BILL_ID": params["BILL_ID"], "VOTE_TCNT": 100, "YES_TCNT": 80}]
+        return []
+
+    mock_client.get_data.side_effect = side_effect
+
+    report = await smart_service.get_committee_voting_stats("정무")
+
+    assert [b["BILL_NAME"] for b in report.bills_detail] == ["정무법안"]
+    search_params = [
+        c.kwargs["params"]
+        for c in mock_client.get_data.call_args_list
+        if c.kwargs["service_id_or_name"] == bill_service.BILL_SEARCH_ID
+    ]
+    # A partial name is never sent upstream, and the full page is still fetched
+    assert all("CURR_COMMITTEE" not in p for p in search_params)
+    assert {p["pSize"] for p in search_params} == {500}
+
+
+@pytest.mark.asyncio
+async def test_topic_voting_stats_keeps_bill_order(smart_service, mock_client):
+    bill_service = smart_service.bill_service
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.BILL_SEARCH_ID:
+            return [{"BILL_ID": f"PRC_{i}", "BILL_NAME": f"AI 법안{i}", "PROC_STATUS": "수정가결"} for i in (1, 2, 3)]
+        if service_id_or_name == bill_service.VOTING_SUMMARY_ID:
+            if params["BILL_ID"] == "PRC_1":
+                raise ValueError("broken summary")
+            return [{"BILL_ID": params["BILL_ID"], "VOTE_TCNT": 200, "YES_TCNT": 150}]
+        return []
+
+    mock_client.get_data.side_effect = side_effect
+
+    stats = await smart_service.get_topic_voting_stats("AI")
+
+    assert stats.bill_count == 2
+    assert [r["BILL_NAME"] for r in stats.individual_results] == ["AI 법안2", "AI 법안3"]
+    assert stats.avg_yes_rate == 75.0
+
+
+@pytest.mark.asyncio
+async def test_analyze_voting_trends_only_summarizes_voted_bills(smart_service, mock_client):
+    bill_service = smart_service.bill_service
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.BILL_SEARCH_ID:
+            if params["AGE"] != "22":
+                return []
+            return [
+                {"BILL_ID": "PRC_1", "BILL_NAME": "의결 법안", "PROC_STATUS": "의결"},
+                {"BILL_ID": "PRC_2", "BILL_NAME": "접수 법안", "PROC_STATUS": "접수"},
+                {"BILL_ID": "PRC_3", "BILL_NAME": "심의 법안", "PROC_STATUS": "본회의 심의"},
+            ]
+        if service_id_or_name == bill_service.VOTING_SUMMARY_ID:
+            return [{"BILL_ID": params["BILL_ID"], "VOTE_TCNT": 10, "YES_TCNT": 9}]
+        return []
+
+    mock_client.get_data.side_effect = side_effect
+
+    trends = await smart_service.analyze_voting_trends("AI")
+
+    assert trends["analyzed_count"] == 2
+    assert [s["BILL_ID"] for s in trends["voting_summaries"]] == ["PRC_1", "PRC_3"]
+
+
+@pytest.mark.asyncio
+async def test_get_bill_history_orders_events(smart_service, mock_client):
+    bill_service = smart_service.bill_service
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.BILL_SEARCH_ID:
+            if params["AGE"] != "22":
+                return []
+            return [
+                {
+                    "BILL_ID": "PRC_1",
+                    "BILL_NO": "2200001",
+                    "BILL_NAME": "법안",
+                    "PROPOSE_DT": "20240105",
+                    "COMMITTEE_DT": "20240110",
+                }
+            ]
+        if service_id_or_name == bill_service.BILL_DETAIL_ID:
+            return [{"MAIN_CNTS": "내용"}]
+        # get_meeting_records
+        return [
+            {"CONF_DATE": "20240201", "COMM_NAME": "법제사법위원회", "CONF_TITLE": "2차"},
+            {"CONF_DATE": "2024.01.08", "COMM_NAME": "법제사법위원회", "CONF_TITLE": "1차"},
+        ]
+
+    mock_client.get_data.side_effect = side_effect
+
+    history = await smart_service.get_bill_history("PRC_1")
+
+    assert [(h["date"], h["event"]) for h in history] == [
+        ("2024-01-05", "의안 발의"),
+        ("2024-01-08", "위원회 회의"),
+        ("2024-01-10", "위원회 회부"),
+        ("2024-02-01", "위원회 회의"),
+    ]
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -76,6 +77,25 @@ async def test_get_member_voting_history(bill_service, mock_client):
     assert records[0].RESULT_VOTE_MOD == "찬성"
 
 
+@pytest.mark.asyncio
+async def test_get_bill_voting_summaries_keeps_order(bill_service, mock_client):
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if params["BILL_ID"] == "PRC_2":
+            raise ValueError("broken summary")
+        if params["BILL_ID"] == "PRC_3":
+            return []
+        return [{"BILL_ID": params["BILL_ID"], "VOTE_TCNT": "100", "YES_TCNT": "90"}]
+
+    mock_client.get_data.side_effect = side_effect
+
+    summaries = await bill_service.get_bill_voting_summaries(["PRC_1", "PRC_2", "PRC_3"], age="21")
+
+    assert summaries[0].BILL_ID == "PRC_1"
+    assert summaries[1] is None
+    assert summaries[2] is None
+    assert {c.kwargs["params"]["AGE"] for c in mock_client.get_data.call_args_list} == {"21"}
+
+
 @pytest.mark.asyncio
 async def test_get_representative_report(smart_service, mock_client):
     mock_client.get_data.side_effect = [
@@ -105,13 +125,39 @@ async def test_get_representative_report(smart_service, mock_client):
     assert report.summary_stats["total_bills_22nd"] == 1
 
 
+@pytest.mark.asyncio
+async def test_representative_report_committee_expertise(smart_service, mock_client):
+    member_service = smart_service.member_service
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == member_service.MEMBER_CAREER_ID:
+            return [
+                {"HG_NM": "홍길동", "PROFILE_SJ": "법제사법위원회 위원", "FRTO_DATE": "2020.05.30 ~ 2021.05.29"},
+                {"HG_NM": "홍길동", "PROFILE_SJ": "법제사법위원회 위원", "FRTO_DATE": "2021.6.1 ~ 2021.6.20"},
+                {"HG_NM": "홍길동", "PROFILE_SJ": "정무위원회 위원", "FRTO_DATE": "2019.01.01 ~ 2019.03.01"},
+                {"HG_NM": "홍길동", "PROFILE_SJ": "교육위원회 위원", "FRTO_DATE": "미상 ~ 2019.03.01"},
+                {"HG_NM": "홍길동", "PROFILE_SJ": "국방위원회 위원", "FRTO_DATE": "2019.02.31 ~ 2019.06.01"},
+                {"HG_NM": "홍길동", "PROFILE_SJ": "외교통일위원회 위원", "FRTO_DATE": "2019.06.xx ~ 2019.09.01"},
+                {"HG_NM": "홍길동", "PROFILE_SJ": "환경노동위원회 위원", "FRTO_DATE": "19.06.10 ~ 2019.09.01"},
+            ]
+        return []
+
+    mock_client.get_data.side_effect = side_effect
+
+    report = await smart_service.get_representative_report("홍길동")
+
+    assert report.summary_stats["expertise"] == ["법제사법위원회 위원(13개월)", "정무위원회 위원(2개월)"]
+
+
 @pytest.mark.asyncio
 async def test_get_bill_voting_results(smart_service, mock_client):
-    mock_client.get_data.side_effect = [
-        # get_bill_voting_summary
-        [{"BILL_ID": "V1", "BILL_NAME": "법안1", "YES_TCNT": "100"}],
+    bill_service = smart_service.bill_service
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.VOTING_SUMMARY_ID:
+            return [{"BILL_ID": "V1", "BILL_NAME": "법안1", "YES_TCNT": "100"}]
         # get_member_voting_history (sample)
-        [
+        return [
             {
                 "BILL_ID": "V1",
                 "BILL_NAME": "법안1",
@@ -126,11 +172,37 @@ async def test_get_bill_voting_results(smart_service, mock_client):
                 "POLY_NM": "B당",
                 "HG_NM": "의원2",
             },
-        ],
-    ]
+        ]
+
+    mock_client.get_data.side_effect = side_effect
 
     results = await smart_service.get_bill_voting_results("V1")
 
     assert results["voting_summary"]["YES_TCNT"] == 100
     assert results["party_trend_sample"]["A당"]["찬성"] == 1
     assert results["party_trend_sample"]["B당"]["반대"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_bill_voting_results_without_summary_ignores_records(smart_service, mock_client):
+    bill_service = smart_service.bill_service
+
+    records_cancelled = asyncio.Event()
+
+    async def side_effect(service_id_or_name, params, **kwargs):
+        if service_id_or_name == bill_service.VOTING_SUMMARY_ID:
+            return []
+        # A records lookup that never finishes on its own
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            records_cancelled.set()
+            raise
+
+    mock_client.get_data.side_effect = side_effect
+
+    results = await asyncio.wait_for(smart_service.get_bill_voting_results("V1"), timeout=1)
+
+    assert results == {"bill_id": "V1", "message": "데이터 없음"}
+    # The unneeded upstream records call is cancelled rather than left running
+    await asyncio.wait_for(records_cancelled.wait(), timeout=1)